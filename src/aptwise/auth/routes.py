@@ -1,6 +1,8 @@
 """
 Authentication routes for user registration, login, and logout.
 """
+import secrets
+import string
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends, Response, status
 from fastapi.responses import RedirectResponse
@@ -28,6 +30,9 @@ from .github_service import github_oauth_service
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+# Characters used for the random passwords of OAuth-only accounts
+_OAUTH_PASSWORD_ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*"
+
 
 @router.post("/create-account", response_model=UserResponse)
 async def create_account(user_data: UserCreate, response: Response):
@@ -43,10 +48,8 @@ async def create_account(user_data: UserCreate, response: Response):
     if user_data.is_oauth_only and not password_to_hash:
         # Generate a secure random password for OAuth-only users
         # They won't need this password as they'll login via OAuth
-        import secrets
-        import string
-        alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-        password_to_hash = ''.join(secrets.choice(alphabet) for i in range(32))
+        password_to_hash = ''.join(secrets.choice(_OAUTH_PASSWORD_ALPHABET)
+                                   for _ in range(32))
     elif not password_to_hash:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
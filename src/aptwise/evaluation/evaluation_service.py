@@ -1,17 +1,80 @@
 """
 Interview evaluation service using Gemini AI with vector database context.
 """
+import copy
+import functools
+import hashlib
 import os
 import json
-from typing import Dict, List, Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 import google.generativeai as genai
 from datetime import datetime
 import logging
-from ..utils.qdrant_service import QdrantVectorService
+from ..utils.qdrant_service import get_qdrant_service
 from ..database import get_user_skills, update_user_skills_from_evaluation
 
 logger = logging.getLogger(__name__)
 
+# How long a finished evaluation is reused for the same interview input
+RESULT_CACHE_TTL_SECONDS = int(
+    os.getenv("EVALUATION_CACHE_TTL_SECONDS", "600")
+)
+RESULT_CACHE_MAX_ENTRIES = 128
+
+
+def _section_score(data: Dict[str, Any], key: str) -> Any:
+    """Read data[key]['score'], treating a missing section as 0."""
+    return (data.get(key) or {}).get('score', 0)
+
+
+def _format_transcript(conversation_history: List[Dict[str, str]]) -> str:
+    """Render the conversation as an Interviewer/Candidate transcript."""
+    return "".join(
+        f"{'Interviewer' if message['role'] == 'assistant' else 'Candidate'}"
+        f": {message['content']}\n\n"
+        for message in conversation_history
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_summary(overall_score: float, grade: str,
+                    reference_coverage: str,
+                    strength: Optional[str],
+                    improvement: Optional[str]) -> str:
+    """
+    Format the evaluation summary text.
+
+    Takes only immutable values copied out of the evaluation, so the cache
+    is keyed by content and repeat renders of an evaluation are hits.
+    """
+    # Determine performance level
+    if overall_score >= 90:
+        performance_level = "Excellent"
+    elif overall_score >= 80:
+        performance_level = "Good"
+    elif overall_score >= 70:
+        performance_level = "Satisfactory"
+    elif overall_score >= 60:
+        performance_level = "Needs Improvement"
+    else:
+        performance_level = "Poor"
+
+    summary = (f"Overall Performance: {performance_level} "
+               f"(Score: {overall_score}/100, Grade: {grade}). ")
+    summary += f"Reference Knowledge Coverage: {reference_coverage}%. "
+
+    # Add key strengths and improvements
+    if strength is not None:
+        summary += f"Key Strength: {strength}. "
+    if improvement is not None:
+        summary += f"Priority Improvement: {improvement}."
+
+    return summary
+
 
 class InterviewEvaluationService:
     """Service for evaluating interview performance using Gemini AI with
@@ -23,11 +86,19 @@ class InterviewEvaluationService:
         if not api_key:
             raise ValueError("GEMINI_API_KEY environment variable is required")
 
-        genai.configure(api_key=api_key)
+        genai.configure(api_key=api_key, transport='grpc')
         self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
 
-        # Initialize vector service for reference answers
-        self.vector_service = QdrantVectorService()
+        # Reuse the process-wide vector service for reference answers
+        self.vector_service = get_qdrant_service()
+
+        # Recent successful evaluations, keyed by a hash of their input
+        self._results: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = \
+            OrderedDict()
+        # Evaluations in progress, so concurrent requests for the same
+        # input wait for one Gemini call instead of each making their own
+        self._in_flight: Dict[str, Future] = {}
+        self._results_lock = threading.Lock()
 
         logger.info("Interview evaluation service initialized with vector "
                     "database support")
@@ -65,14 +136,15 @@ class InterviewEvaluationService:
                 'skills_assessed': skills
             }
 
-            # For each question, find the most similar reference Q&A pair
-            for i, question in enumerate(interview_questions):
-                # Search for similar questions in vector DB
-                search_results = self.vector_service.search(
-                    query_text=question,
-                    n_results=3  # Get top 3 similar questions
-                )
+            # Find the most similar reference Q&A pair for every question
+            # with a single batched search
+            batch_results = self.vector_service.search_batch(
+                interview_questions,
+                n_results=3  # Get top 3 similar questions
+            )
 
+            for i, (question, search_results) in enumerate(
+                    zip(interview_questions, batch_results)):
                 if search_results:
                     # Take the most similar result
                     best_match = search_results[0]
@@ -139,36 +211,30 @@ class InterviewEvaluationService:
         """
         try:
             # Get skills that were actually assessed
-            assessed_skills = set()
-            if 'skill_performance_summary' in evaluation_result:
-                assessed_skills.update(
-                    evaluation_result['skill_performance_summary'].keys()
-                    )
-            if 'skill_level_assessment' in evaluation_result:
-                assessed_skills.update(
-                    evaluation_result['skill_level_assessment'].keys()
-                    )
+            assessed_skills = frozenset(
+                evaluation_result.get('skill_performance_summary', {}).keys()
+                | evaluation_result.get('skill_level_assessment', {}).keys()
+            )
 
-            # Find skills that were expected but not assessed
-            expected_skills_set = set(expected_skills) \
-                if expected_skills else set()
-            unassessed_skills = expected_skills_set - assessed_skills
+            # Find skills that were expected but not assessed, in the order
+            # they were expected
+            unassessed_skills = [
+                skill for skill in dict.fromkeys(expected_skills or [])
+                if skill not in assessed_skills
+            ]
 
             # Add unassessed skills section
+            evaluation_result['skills_not_assessed'] = [
+                {
+                    'skill': skill,
+                    'reason': f"No questions about {skill} were asked "
+                              "during the interview"
+                }
+                for skill in unassessed_skills
+            ]
             if unassessed_skills:
-                unassessed_list = []
-                for skill in unassessed_skills:
-                    unassessed_list.append({
-                        'skill': skill,
-                        'reason': f"No questions about {skill} \
-                            were asked during the interview"
-                    })
-
-                evaluation_result['skills_not_assessed'] = unassessed_list
                 logger.info(f"Added {len(unassessed_skills)} \
                             unassessed skills to evaluation result")
-            else:
-                evaluation_result['skills_not_assessed'] = []
 
             return evaluation_result
 
@@ -196,16 +262,23 @@ class InterviewEvaluationService:
             Dictionary containing evaluation results
         """
         try:
-            # Get reference context from vector database
             skills = interview_data.get('skills', [])
-            reference_context = \
-                self.get_reference_context(skills,
-                                           conversation_history)
 
-            # Get user's current skill levels if email is provided
-            current_user_skills = {}
-            if user_email:
-                current_user_skills = self.get_user_current_skills(user_email)
+            # Fetch the user's current skill levels from the database while
+            # the reference context is retrieved; neither depends on the
+            # other
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                user_skills_future = executor.submit(
+                    self.get_user_current_skills, user_email
+                ) if user_email else None
+
+                # Get reference context from vector database
+                reference_context = \
+                    self.get_reference_context(skills,
+                                               conversation_history)
+
+                current_user_skills = user_skills_future.result() \
+                    if user_skills_future else {}
 
             # Build the evaluation prompt with
             # reference context and current skills
@@ -260,6 +333,75 @@ class InterviewEvaluationService:
                 "evaluation": None
             }
 
+    def get_or_evaluate_interview(self,
+                                  interview_data: Dict[str, Any],
+                                  conversation_history: List[Dict[str, str]],
+                                  user_email: str = None
+                                  ) -> Dict[str, Any]:
+        """
+        Evaluate an interview, reusing a recent result for the same input.
+
+        The evaluate, metrics and summary endpoints receive the same
+        interview; only the first runs the Gemini evaluation (and the
+        skill level update), the others reuse its result or wait for it
+        if it is still running. Each caller gets its own copy.
+
+        Args:
+            interview_data: Dictionary containing interview metadata
+            conversation_history: List of conversation messages
+            user_email: User's email for skill level updates (optional)
+
+        Returns:
+            Dictionary containing evaluation results
+        """
+        key = hashlib.blake2b(
+            json.dumps([interview_data, conversation_history, user_email],
+                       sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+
+        with self._results_lock:
+            entry = self._results.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._results.move_to_end(key)
+                logger.info("Reusing cached evaluation result")
+                return copy.deepcopy(entry[1])
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not owner:
+            logger.info("Waiting for in-flight evaluation result")
+            return copy.deepcopy(future.result())
+
+        try:
+            evaluation_result = self.evaluate_interview(interview_data,
+                                                        conversation_history,
+                                                        user_email)
+        except Exception as e:
+            with self._results_lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        with self._results_lock:
+            del self._in_flight[key]
+            # Failures are not cached, so a retry evaluates again
+            if evaluation_result.get('success'):
+                self._results[key] = (
+                    time.monotonic() + RESULT_CACHE_TTL_SECONDS,
+                    evaluation_result
+                )
+                self._results.move_to_end(key)
+                while len(self._results) > RESULT_CACHE_MAX_ENTRIES:
+                    self._results.popitem(last=False)
+        future.set_result(evaluation_result)
+
+        return copy.deepcopy(evaluation_result)
+
     def _build_evaluation_prompt_with_context(self,
                                               interview_data:
                                               Dict[str, Any],
@@ -280,20 +422,7 @@ class InterviewEvaluationService:
         user_name = interview_data.get('userName', 'Candidate')
 
         # Format conversation history
-        conversation_text = ""
-        user_answers = []
-
-        for message in conversation_history:
-            role_label = ("Interviewer" if message['role'] == 'assistant'
-                          else "Candidate")
-            conversation_text += f"{role_label}: {message['content']}\n\n"
-
-            # Extract user answers for individual assessment
-            if message['role'] == 'user':
-                user_answers.append({
-                    'answer_index': len(user_answers),
-                    'content': message['content']
-                })
+        conversation_text = _format_transcript(conversation_history)
 
         skills_text = ", ".join(skills) \
                       if skills else "General interview skills"
@@ -304,14 +433,12 @@ class InterviewEvaluationService:
             'questions_with_references', [])
 
         if questions_with_refs:
-            reference_text = "\n**REFERENCE QUESTION-ANSWER PAIRS:**\n"
-            for ref in questions_with_refs:
-                similarity = ref.get('similarity_score', 0.0)
-                reference_text += f"""
+            reference_text = "\n**REFERENCE QUESTION-ANSWER PAIRS:**\n" + \
+                "".join(f"""
 Q{ref['question_index'] + 1}: {ref['interview_question']}
 Reference Answer: {ref['reference_answer']}
-Similarity Score: {similarity:.2f}
----"""
+Similarity Score: {ref.get('similarity_score', 0.0):.2f}
+---""" for ref in questions_with_refs)
         else:
             reference_text = ("\n**No reference answers available from "
                               "vector database.**\n")
@@ -319,10 +446,12 @@ Similarity Score: {similarity:.2f}
         # Format current user skills
         current_skills_text = ""
         if current_user_skills:
-            current_skills_text = "\n**USER'S CURRENT SKILL LEVELS:**\n"
-            for skill, level in current_user_skills.items():
-                current_skills_text += f"{skill}: Level {level}/5\n"
-            current_skills_text += "---\n"
+            current_skills_text = (
+                "\n**USER'S CURRENT SKILL LEVELS:**\n"
+                + "".join(f"{skill}: Level {level}/5\n"
+                          for skill, level in current_user_skills.items())
+                + "---\n"
+            )
         else:
             current_skills_text = "\n**No previous skill \
                 assessments available.**\n"
@@ -532,12 +661,7 @@ Similarity Score: {similarity:.2f}
         user_name = interview_data.get('userName', 'Candidate')
 
         # Format conversation history
-        conversation_text = ""
-        for message in conversation_history:
-            role_label = ("Interviewer"
-                          if message['role'] == 'assistant'
-                          else "Candidate")
-            conversation_text += f"{role_label}: {message['content']}\n\n"
+        conversation_text = _format_transcript(conversation_history)
 
         skills_text = (", ".join(skills)
                        if skills else "General interview skills")
@@ -1138,21 +1262,18 @@ Similarity Score: {similarity:.2f}
         answer_metrics = []
 
         for assessment in detailed_breakdown:
-            eval_data = assessment.get('evaluation', {})
+            eval_data = assessment.get('evaluation') or {}
+            correctness = _section_score(eval_data, 'correctness')
+            completeness = _section_score(eval_data, 'completeness')
+            confidence = _section_score(eval_data, 'confidence')
             answer_metrics.append({
                 'question_number': assessment.get('question_number', 0),
                 'question': assessment.get('question', ''),
-                'correctness_score':
-                    eval_data.get('correctness', {}).get('score', 0),
-                'completeness_score':
-                    eval_data.get('completeness', {}).get('score', 0),
-                'confidence_score':
-                    eval_data.get('confidence', {}).get('score', 0),
-                'overall_score': (
-                    eval_data.get('correctness', {}).get('score', 0) +
-                    eval_data.get('completeness', {}).get('score', 0) +
-                    eval_data.get('confidence', {}).get('score', 0)
-                ) / 3 if eval_data else 0
+                'correctness_score': correctness,
+                'completeness_score': completeness,
+                'confidence_score': confidence,
+                'overall_score': (correctness + completeness + confidence) / 3
+                if eval_data else 0
             })
 
         # Fallback to old structure if new one is not available
@@ -1164,11 +1285,11 @@ Similarity Score: {similarity:.2f}
                     'question_number': assessment.get('question_number', 0),
                     'question': assessment.get('question', ''),
                     'correctness_score':
-                        assessment.get('accurateness', {}).get('score', 0),
+                        _section_score(assessment, 'accurateness'),
                     'completeness_score':
-                        assessment.get('completeness', {}).get('score', 0),
+                        _section_score(assessment, 'completeness'),
                     'confidence_score':
-                        assessment.get('confidence', {}).get('score', 0),
+                        _section_score(assessment, 'confidence'),
                     'overall_score': assessment.get('overall_answer_score', 0)
                 })
 
@@ -1201,14 +1322,9 @@ Similarity Score: {similarity:.2f}
             'reference_coverage_score':
                 evaluation.get('reference_coverage_score', 0),
             'dimension_scores': {
-                'technical_competency':
-                    evaluation.get('technical_competency', {}).get('score', 0),
-                'communication_skills':
-                    evaluation.get('communication_skills', {}).get('score', 0),
-                'problem_solving':
-                    evaluation.get('problem_solving', {}).get('score', 0),
-                'cultural_fit':
-                    evaluation.get('cultural_fit', {}).get('score', 0)
+                key: _section_score(evaluation, key)
+                for key in ('technical_competency', 'communication_skills',
+                            'problem_solving', 'cultural_fit')
                 },
             'assessment_averages': {
                 'correctness': round(avg_correctness, 1),
@@ -1243,37 +1359,16 @@ Similarity Score: {similarity:.2f}
             return "Evaluation could not be completed due to an error."
 
         evaluation = evaluation_result.get('evaluation', {})
-        overall_score = evaluation.get('final_score',
-                                       evaluation.get('overall_score', 0))
-        grade = evaluation.get('interview_grade', 'N/A')
-        reference_coverage = evaluation.get('reference_coverage_score', 0)
-
-        # Determine performance level
-        if overall_score >= 90:
-            performance_level = "Excellent"
-        elif overall_score >= 80:
-            performance_level = "Good"
-        elif overall_score >= 70:
-            performance_level = "Satisfactory"
-        elif overall_score >= 60:
-            performance_level = "Needs Improvement"
-        else:
-            performance_level = "Poor"
-
-        summary = (f"Overall Performance: {performance_level} "
-                   f"(Score: {overall_score}/100, Grade: {grade}). ")
-        summary += f"Reference Knowledge Coverage: {reference_coverage}%. "
-
-        # Add key strengths and improvements
         strengths = evaluation.get('strengths', [])
         improvements = evaluation.get('areas_for_improvement', [])
 
-        if strengths:
-            summary += f"Key Strength: {strengths[0]}. "
-        if improvements:
-            summary += f"Priority Improvement: {improvements[0]}."
-
-        return summary
+        return _format_summary(
+            evaluation.get('final_score', evaluation.get('overall_score', 0)),
+            str(evaluation.get('interview_grade', 'N/A')),
+            str(evaluation.get('reference_coverage_score', 0)),
+            str(strengths[0]) if strengths else None,
+            str(improvements[0]) if improvements else None
+        )
 
 
 # Create a singleton instance
@@ -2,6 +2,7 @@
 API routes for interview evaluation.
 """
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from .models import EvaluationRequest, EvaluationResponse
 from .evaluation_service import evaluation_service
 from ..auth.utils import get_current_user
@@ -68,7 +69,10 @@ async def evaluate_interview(
     """
     try:
         # Perform the evaluation
-        evaluation_result = evaluation_service.evaluate_interview(
+        # The evaluation is blocking; run it in the worker thread pool so
+        # concurrent requests can share one in-flight evaluation
+        evaluation_result = await run_in_threadpool(
+            evaluation_service.get_or_evaluate_interview,
             interview_data=request.interview_data,
             conversation_history=request.conversation_history,
             user_email=current_user if current_user else None
@@ -127,7 +131,8 @@ async def extract_evaluation_metrics(
    """
     try:
         # Perform the evaluation
-        evaluation_result = evaluation_service.evaluate_interview(
+        evaluation_result = await run_in_threadpool(
+            evaluation_service.get_or_evaluate_interview,
             interview_data=request.interview_data,
             conversation_history=request.conversation_history,
             user_email=current_user if current_user else None
@@ -164,7 +169,8 @@ async def get_evaluation_summary(
     """
     try:
         # Perform the evaluation
-        evaluation_result = evaluation_service.evaluate_interview(
+        evaluation_result = await run_in_threadpool(
+            evaluation_service.get_or_evaluate_interview,
             interview_data=request.interview_data,
             conversation_history=request.conversation_history,
             user_email=current_user if current_user else None
@@ -6,15 +6,132 @@ import logging
 import os
 import random
 import re
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 
+import anyio
 import google.generativeai as genai
+import numpy as np
 
-from ..utils.qdrant_service import QdrantVectorService
+from ..utils.qdrant_service import get_qdrant_service
 from ..utils.updation_service import get_updation_service
 
 logger = logging.getLogger(__name__)
 
+# Static persona/constraint prompt, identical for every interview and set
+# once as the model's system instruction; the session's user details and
+# skills are sent with each turn by _build_prompt
+_SYSTEM_PROMPT = """
+        ## Core Objective & Persona
+        You are an expert technical interviewer named AptWise. \
+            Your goal is to conduct a realistic and engaging interview \
+            with the user described in the "Interview Details" given \
+            with each turn, for the role and company listed there.
+        -   **Persona:** Be friendly, professional, and encouraging. \
+            Use the user's first name to build rapport.
+        -   **Interaction Style:** Your responses should be \
+            conversational, concise, and feel like a real human \
+            interaction. Avoid robotic or overly formal language.
+
+        ---
+
+        ## CRITICAL CONSTRAINT - SKILLS RESTRICTION
+        **YOU MUST ONLY ASK QUESTIONS ABOUT THE ALLOWED SKILLS \
+        listed in the "Interview Details".**
+
+        **NEVER ask questions about skills not in this list. \
+        ALL questions must be directly related to one or more \
+        of these specific skills. Also keep it fast moving. Do \
+        not linger on any one question for too long. Keep \
+        changing the topic frequently. Do not keep asking \
+        from the same topic again and again.**
+        ---
+
+        ## Core Task
+        Your task is to generate a JSON object containing two keys: \
+            "Response" and "SearchContext".
+        1.  **Evaluate the User's Last Answer:** Analyze the \
+            "User's Latest Response" given with each turn.
+        2.  **Formulate a Reply:** Craft a "Response" that replies to \
+            the user's answer.
+        3.  **Ask a New Question:** In the same "Response", ask a new, \
+            single question based on the provided context and \
+            the user's performance so far. You can refer to \
+            the "Available Questions" given with each turn for ideas. \
+            Do not ask any question that was previously asked \
+            in the conversation history.
+        4.  **Plan the Next Topic:** Decide what topic you will ask \
+            about in the *following* turn and place it in "SearchContext".
+
+        ---
+
+        ## Key Instructions & Logic
+
+        ### 1. Replying to the User
+        -   **If Correct:** Acknowledge the correct answer briefly and \
+            positively.
+        -   **If Partially Correct or Incorrect:** Gently correct the user. \
+            Provide a very brief and clear explanation of the mistake. You \
+            can then ask a clarifying question on the same topic to test \
+            their understanding or move on.
+            -   *Example Correction:* "That's on the right track, \
+                but there's a key distinction you missed. \
+                React DOM is specifically the package that acts as the 'glue' \
+                between the Virtual DOM and the browser's real DOM. It’s \
+                not the DOM itself."
+
+        ### 2. Questioning Strategy
+        -   **SKILLS RESTRICTION:** You can ONLY ask questions \
+            about the allowed skills.
+        -   **One Question at a Time:** **NEVER** ask more than one \
+            question in your response.
+        -   **Adaptive Difficulty:** Adjust the question difficulty based \
+            on the user's performance. If the user is answering \
+            well, ask more complex, scenario-based \
+            questions. If they are struggling, ask more foundational, \
+            theoretical questions.
+        -   **Topic Selection:** You can ask follow-up questions \
+            on the same topic to dig deeper or pivot to a new topic \
+            from the allowed skills list. You can choose a single \
+            topic, mix topics and can ask direct questions, scenario \
+            based questions, or conceptual questions.
+
+        ### 3. The `SearchContext` Field - **CRITICAL INSTRUCTION**
+        -   The `SearchContext` field is for **planning ahead**. \
+            It must contain the topic of the question you intend \
+            to ask in your **next turn** (i.e., *after* the user answers\
+            the question you are asking in the current response).
+        -   **IMPORTANT:** The SearchContext MUST be one of the \
+            allowed skills.
+        -   **Example:** If allowed skills are Python, Machine Learning, SQL, \
+            you can only use these topics in SearchContext.
+
+        ---
+
+        ## Output Format
+        Generate your response **only** in the following JSON format\
+                Do not add any text before or after the JSON object.
+
+        ```json
+        {
+            "Response": "Your full response to the user, \
+                including feedback on their last answer and \
+                the new question about one of the allowed \
+                skills. Ensure that the response is in a single \
+                paragraph.",
+            "SearchContext": "One of the allowed skills that you \
+                plan to ask about in your NEXT turn"
+        }
+"""
+
+
+# A sentence ending in a question mark
+_QUESTION = re.compile(r'[^.!?]*\?')
+
+
+def _to_score(value: float) -> int:
+    """Map a value in [0, 1] onto the 1-5 evaluation scale."""
+    return int(round(1 + 4 * value))
+
 
 class AIInterviewService:
     """Service for handling AI-powered interview interactions."""
@@ -28,11 +145,13 @@ class AIInterviewService:
             )
 
         # Configure Gemini API
-        genai.configure(api_key=self.gemini_api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
+        genai.configure(api_key=self.gemini_api_key, transport='grpc')
+        self.model_name = 'gemini-2.5-flash-lite'
+        self.model = genai.GenerativeModel(self.model_name,
+                                           system_instruction=_SYSTEM_PROMPT)
 
-        # Initialize vector service for RAG
-        self.vector_service = QdrantVectorService()
+        # Vector service for RAG, shared with the other services
+        self.vector_service = get_qdrant_service()
 
         # Initialize updation service for question storage
         self.updation_service = get_updation_service()
@@ -111,6 +230,74 @@ class AIInterviewService:
             logger.error("Error getting skill context: %s", e)
             return f"Error retrieving context for topic: {selected_skill}"
 
+    def get_answer_references(self,
+                              conversation_history: str
+                              ) -> List[Dict[str, Any]]:
+        """
+        Get reference answers for the question the user just answered.
+
+        Args:
+            conversation_history: Previous conversation as a string
+
+        Returns:
+            Search results for the last question asked, or an empty list
+            if the user has not answered a question yet
+        """
+        question = self._get_last_question(conversation_history)
+        if not question:
+            return []
+
+        try:
+            return self.vector_service.search(query_text=question,
+                                              n_results=5)
+        except Exception as e:
+            logger.error("Error getting answer references: %s", e)
+            return []
+
+    def evaluate_response(self,
+                          user_response: str,
+                          references: List[Dict[str, Any]]
+                          ) -> Optional[Dict[str, int]]:
+        """
+        Score the user's latest answer locally against reference answers.
+
+        Correctness and completeness come from the cosine similarity between
+        the answer and the reference answers (best and average match), and
+        confidence from the answer length relative to the references.
+
+        Args:
+            user_response: The user's latest answer
+            references: Search results containing reference answers
+
+        Returns:
+            Dictionary with confidence, correctness and completeness scores
+            from 1-5, or None if there is nothing to compare against
+        """
+        answers = [ref.get('answer', '') for ref in references
+                   if ref.get('answer')]
+        if not user_response or not answers:
+            return None
+
+        try:
+            embeddings = self.vector_service.model.encode(
+                [user_response] + answers,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+            similarities = np.clip(embeddings[1:] @ embeddings[0], 0.0, 1.0)
+            expected_len = sum(len(a) for a in answers) / len(answers)
+            length_ratio = min(len(user_response) / expected_len, 1.0)
+
+            return {
+                'confidence': _to_score(length_ratio),
+                'correctness': _to_score(float(similarities.max())),
+                'completeness': _to_score(float(similarities.mean()))
+            }
+
+        except Exception as e:
+            logger.error("Error evaluating response locally: %s", e)
+            return None
+
     def _extract_and_store_question(self,
                                     response_text: str,
                                     skills: List[str],
@@ -257,144 +444,289 @@ class AIInterviewService:
             Dictionary containing the response and metadata
         """
         try:
-            # Get context from vector database
-            skill_context = self.get_skill_context(skills,
-                                                   search_context)
-
-            # Build the prompt
-            prompt = self._build_prompt(user_details,
-                                        skills,
-                                        skill_context,
-                                        conversation_history)
-
-            # Log the full prompt before calling Gemini API
-            logger.info("=" * 80)
-            logger.info("PROMPT BEING SENT TO GEMINI API:")
-            logger.info("=" * 80)
-            logger.info(prompt)
-            logger.info("=" * 80)
-
-            # Log basic info without printing full context
-            logger.info(
-                "Gemini API Request - User: %s, Skills: %s",
-                user_details.get('userName', 'candidate'), skills
+            model, prompt, references = self._prepare_generation(
+                user_details, skills, conversation_history, search_context
             )
 
             # Generate response using Gemini
-            response = self.model.generate_content(prompt)
+            response = model.generate_content(prompt)
 
-            if response.text:
-                logger.info("Gemini API Response generated successfully")
+            return self._process_response(
+                response.text, user_details, skills, conversation_history,
+                references, store_questions
+            )
 
-                # Log the full LLM response
-                logger.info("=" * 80)
-                logger.info("GEMINI API RESPONSE:")
-                logger.info("=" * 80)
-                logger.info(response.text)
-                logger.info("=" * 80)
+        except Exception as e:
+            logger.error("Error generating interview question: %s", e)
+            return self._error_result()
 
-                # Parse the JSON response
-                try:
-                    cleaned_response = response.text.strip()
-                    if cleaned_response.startswith('```json'):
-                        cleaned_response = cleaned_response[7:]
-                    if cleaned_response.endswith('```'):
-                        cleaned_response = cleaned_response[:-3]
-                    cleaned_response = cleaned_response.strip()
-
-                    response_data = json.loads(cleaned_response)
-
-                    # Extract the components
-                    user_response = response_data.get('Response', '')
-                    next_search_context = \
-                        response_data.get('SearchContext', '')
-                    evaluation = response_data.get('Evaluation', {})
-
-                    # Validate that next_search_context is in the skills list
-                    if next_search_context:
-                        context_lower = next_search_context.lower()
-
-                        # Check if search_context matches any skill
-                        valid_context = any(
-                            context_lower in skill.lower()
-                            or skill.lower() in context_lower
-                            for skill in skills
-                        )
-
-                        if not valid_context:
-                            next_search_context = random.choice(skills)
-                            logger.warning(
-                                "AI returned invalid SearchContext. "
-                                "Replaced with: %s", next_search_context
-                            )
+    async def stream_interview_question(
+        self,
+        user_details: Dict[str, Any],
+        skills: List[str],
+        conversation_history: str,
+        search_context: Optional[str] = None,
+        store_questions: bool = True
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Generate an interview question, streaming Gemini's output.
 
-                    logger.info(
-                        "Successfully parsed JSON response. "
-                        "Next search context: %s", next_search_context
-                    )
+        Yields ('chunk', text) events as Gemini produces tokens, followed by
+        a single ('result', dict) event with the same dictionary that
+        generate_interview_question returns.
 
-                    # Store the generated question in vector database
-                    if store_questions:
-                        user_id = user_details.get('userId', '')
-                        interview_session = user_details.get('sessionId', '')
-                        self._extract_and_store_question(
-                            response.text,
-                            skills,
-                            user_id,
-                            interview_session
-                        )
-
-                    return {
-                        'success': True,
-                        'question': user_response,
-                        'search_context': next_search_context,
-                        'evaluation': evaluation
-                    }
-
-                except json.JSONDecodeError as e:
-                    logger.error("Error parsing JSON response: %s", e)
-                    logger.error("Raw response: %s", response.text)
-
-                    # Fallback to raw text if JSON parsing fails
-                    if store_questions:
-                        user_id = user_details.get('userId', '')
-                        interview_session = user_details.get('sessionId', '')
-                        self._extract_and_store_question(
-                            response.text,
-                            skills,
-                            user_id,
-                            interview_session
-                        )
-
-                    return {
-                        'success': True,
-                        'question': response.text.strip(),
-                        'search_context': None,
-                        'evaluation': None
-                    }
+        Args:
+            user_details: User information including name, company, role
+            skills: List of skills for the interview
+            conversation_history: Previous conversation as a string
+            search_context: Topic to search for from previous response
+            store_questions: Whether to store generated questions in vector DB
 
-            else:
-                logger.warning("Gemini API returned no response text")
-                return {
-                    'success': False,
-                    'question': ("I'm having trouble generating "
-                                 "a question right now. Could you tell me "
-                                 "about your experience?"),
-                    'search_context': None,
-                    'evaluation': None
-                }
+        Yields:
+            Tuples of (event type, payload)
+        """
+        try:
+            # Vector search and embedding are blocking, keep them off the
+            # event loop
+            model, prompt, references = await anyio.to_thread.run_sync(
+                self._prepare_generation,
+                user_details, skills, conversation_history, search_context
+            )
+
+            parts = []
+            response = await model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. the final one)
+                    continue
+                parts.append(text)
+                yield 'chunk', text
+
+            result = await anyio.to_thread.run_sync(
+                self._process_response,
+                "".join(parts), user_details, skills, conversation_history,
+                references, store_questions
+            )
 
         except Exception as e:
-            logger.error("Error generating interview question: %s", e)
+            logger.error("Error streaming interview question: %s", e)
+            result = self._error_result()
+
+        yield 'result', result
+
+    def _prepare_generation(
+        self,
+        user_details: Dict[str, Any],
+        skills: List[str],
+        conversation_history: str,
+        search_context: Optional[str] = None
+    ) -> Tuple[genai.GenerativeModel, str, List[Dict[str, Any]]]:
+        """
+        Gather context and build the Gemini model and prompt for a turn.
+
+        Args:
+            user_details: User information including name, company, role
+            skills: List of skills for the interview
+            conversation_history: Previous conversation as a string
+            search_context: Topic to search for from previous response
+
+        Returns:
+            Tuple of (model, per-turn prompt, reference answers for the
+            question just answered)
+        """
+        # Get context for the next question, and reference answers for the
+        # question the user just answered
+        skill_context = self.get_skill_context(skills, search_context)
+        references = self.get_answer_references(conversation_history)
+
+        # Build the prompt - the static persona/constraint block is the
+        # model's system instruction, only the turn is sent
+        prompt = self._build_prompt(
+            user_details, skills, skill_context, conversation_history
+        )
+
+        # Log the full prompt only when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("INTERVIEW PROMPT:\n%s", prompt)
+
+        # Log basic info without printing full context
+        logger.info(
+            "Gemini API Request - User: %s, Skills: %s",
+            user_details.get('userName', 'candidate'), skills
+        )
+
+        return self.model, prompt, references
+
+    def _process_response(
+        self,
+        response_text: str,
+        user_details: Dict[str, Any],
+        skills: List[str],
+        conversation_history: str,
+        references: List[Dict[str, Any]],
+        store_questions: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Parse Gemini's reply and score the user's last answer.
+
+        Args:
+            response_text: Full text generated by Gemini
+            user_details: User information including name, company, role
+            skills: List of skills for the interview
+            conversation_history: Previous conversation as a string
+            references: Reference answers for the question just answered
+            store_questions: Whether to store generated questions in vector DB
+
+        Returns:
+            Dictionary containing the response and metadata
+        """
+        if not response_text:
+            logger.warning("Gemini API returned no response text")
             return {
                 'success': False,
-                'question': ("I'm experiencing some technical "
-                             "difficulties. Let's continue - could you tell "
-                             "me about your background?"),
+                'question': ("I'm having trouble generating "
+                             "a question right now. Could you tell me "
+                             "about your experience?"),
                 'search_context': None,
                 'evaluation': None
             }
 
+        logger.info("Gemini API Response generated successfully")
+
+        # Score the user's last answer locally instead of asking
+        # Gemini to generate the evaluation block
+        evaluation = self.evaluate_response(
+            self._get_latest_user_response(conversation_history),
+            references
+        )
+
+        # Log the full LLM response only when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("INTERVIEW RESPONSE:\n%s", response_text)
+
+        # Store the generated question in vector database
+        if store_questions:
+            self._extract_and_store_question(
+                response_text,
+                skills,
+                user_details.get('userId', ''),
+                user_details.get('sessionId', '')
+            )
+
+        # Parse the JSON response
+        try:
+            cleaned_response = response_text.strip()
+            if cleaned_response.startswith('```json'):
+                cleaned_response = cleaned_response[7:]
+            if cleaned_response.endswith('```'):
+                cleaned_response = cleaned_response[:-3]
+            cleaned_response = cleaned_response.strip()
+
+            response_data = json.loads(cleaned_response)
+
+        except json.JSONDecodeError as e:
+            logger.error("Error parsing JSON response: %s", e)
+            logger.error("Raw response: %s", response_text)
+
+            # Fallback to raw text if JSON parsing fails
+            return {
+                'success': True,
+                'question': response_text.strip(),
+                'search_context': None,
+                'evaluation': evaluation
+            }
+
+        # Extract the components
+        user_response = response_data.get('Response', '')
+        next_search_context = response_data.get('SearchContext', '')
+
+        # Validate that next_search_context is in the skills list
+        if next_search_context:
+            context_lower = next_search_context.lower()
+
+            # Check if search_context matches any skill
+            valid_context = any(
+                context_lower in skill.lower()
+                or skill.lower() in context_lower
+                for skill in skills
+            )
+
+            if not valid_context:
+                next_search_context = random.choice(skills)
+                logger.warning(
+                    "AI returned invalid SearchContext. "
+                    "Replaced with: %s", next_search_context
+                )
+
+        logger.info(
+            "Successfully parsed JSON response. "
+            "Next search context: %s", next_search_context
+        )
+
+        return {
+            'success': True,
+            'question': user_response,
+            'search_context': next_search_context,
+            'evaluation': evaluation
+        }
+
+    @staticmethod
+    def _error_result() -> Dict[str, Any]:
+        """Build the fallback result returned when generation fails."""
+        return {
+            'success': False,
+            'question': ("I'm experiencing some technical "
+                         "difficulties. Let's continue - could you tell "
+                         "me about your background?"),
+            'search_context': None,
+            'evaluation': None
+        }
+
+    def _get_latest_user_response(self, conversation_history: str) -> str:
+        """
+        Extract the user's latest response from the conversation history.
+
+        Args:
+            conversation_history: Previous conversation as a string
+
+        Returns:
+            The user's latest response, or an empty string if there is none
+        """
+        if (not conversation_history or
+                conversation_history == "No previous conversation."):
+            return ""
+
+        # The last line should be the user's latest response
+        last_line = conversation_history.strip().split('\n')[-1]
+        if last_line.startswith('user: '):
+            return last_line[6:]  # Remove 'user: ' prefix
+        return ""
+
+    def _get_last_question(self, conversation_history: str) -> str:
+        """
+        Extract the question the user's latest response answers.
+
+        Args:
+            conversation_history: Previous conversation as a string
+
+        Returns:
+            The last question asked before the user's latest response, or
+            an empty string if there is none
+        """
+        if not self._get_latest_user_response(conversation_history):
+            return ""
+
+        lines = conversation_history.strip().split('\n')
+        for line in reversed(lines[:-1]):
+            if line.startswith('aptwise: '):
+                message = line[9:]  # Remove 'aptwise: ' prefix
+                # The reply opens with feedback, the question comes last
+                questions = _QUESTION.findall(message)
+                return questions[-1].strip() if questions else message
+        return ""
+
     def _build_prompt(
         self,
         user_details: Dict[str, Any],
@@ -403,7 +735,11 @@ class AIInterviewService:
         conversation_history: str
     ) -> str:
         """
-        Build the prompt for Gemini API.
+        Build the per-turn prompt for Gemini API.
+
+        The instructions live in _SYSTEM_PROMPT; the session's user details
+        and skills are sent with each turn so the system instruction is
+        shared by every interview.
 
         Args:
             user_details: User information
@@ -417,136 +753,21 @@ class AIInterviewService:
         user_name = user_details.get('userName', 'candidate')
         company = user_details.get('company', 'the company')
         role = user_details.get('role', 'the position')
-
-        # Extract the user's latest response from conversation history
-        user_response = "No previous response."
-        if (conversation_history and
-                conversation_history != "No previous conversation."):
-            lines = conversation_history.strip().split('\n')
-            if lines:
-                # Get the last line which should be the user's latest response
-                last_line = lines[-1]
-                if last_line.startswith('user: '):
-                    user_response = last_line[6:]  # Remove 'user: ' prefix
+        user_response = (self._get_latest_user_response(conversation_history)
+                         or "No previous response.")
 
         prompt = f"""
-        ## Core Objective & Persona
-        You are an expert technical interviewer named AptWise. \
-            Your goal is to conduct a realistic and engaging interview \
-            with the user, {user_name}, who is applying for the {role} \
-            role at {company}.
-        -   **Persona:** Be friendly, professional, and encouraging. \
-            Use the user's first name, {user_name}, to build rapport.
-        -   **Interaction Style:** Your responses should be \
-            conversational, concise, and feel like a real human \
-            interaction. Avoid robotic or overly formal language.
-
-        ---
-
-        ## CRITICAL CONSTRAINT - SKILLS RESTRICTION
-        **YOU MUST ONLY ASK QUESTIONS ABOUT THE FOLLOWING SKILLS:**
-        {', '.join(skills)}
-
-        **NEVER ask questions about skills not in this list. \
-        ALL questions must be directly related to one or more \
-        of these specific skills. Also keep it fast moving. Do \
-        not linger on any one question for too long. Keep \
-        changing the topic frequently. Do not keep asking \
-        from the same topic again and again.**
-        ---
-
-        ## Core Task
-        Your task is to generate a JSON object containing three keys: \
-            "Response", "SearchContext", and "Evaluation".
-        1.  **Evaluate the User's Last Answer:** Analyze `{user_response}`.
-        2.  **Formulate a Reply:** Craft a "Response" that replies to \
-            the user's answer.
-        3.  **Ask a New Question:** In the same "Response", ask a new, \
-            single question based on the provided context and \
-            the user's performance so far. You can refer to \
-            the "Available Questions" section below for ideas. \
-            Do not ask any question that was previously asked \
-            in the conversation history.
-        4.  **Plan the Next Topic:** Decide what topic you will ask \
-            about in the *following* turn and place it in "SearchContext".
-
-        ---
-
-        ## Key Instructions & Logic
-
-        ### 1. Replying to the User
-        -   **If Correct:** Acknowledge the correct answer briefly and \
-            positively.
-        -   **If Partially Correct or Incorrect:** Gently correct the user. \
-            Provide a very brief and clear explanation of the mistake. You \
-            can then ask a clarifying question on the same topic to test \
-            their understanding or move on.
-            -   *Example Correction:* "That's on the right track, \
-                {user_name}, but there's a key distinction you missed. \
-                React DOM is specifically the package that acts as the 'glue' \
-                between the Virtual DOM and the browser's real DOM. It’s \
-                not the DOM itself."
-
-        ### 2. Questioning Strategy
-        -   **SKILLS RESTRICTION:** You can ONLY ask questions \
-            about the skills provided above.
-        -   **One Question at a Time:** **NEVER** ask more than one \
-            question in your response.
-        -   **Adaptive Difficulty:** Adjust the question difficulty based \
-            on the user's performance. If `{user_name}` is answering \
-            well (high evaluation scores), ask more complex, scenario-based \
-            questions. If they are struggling, ask more foundational, \
-            theoretical questions.
-        -   **Topic Selection:** You can ask follow-up questions \
-            on the same topic to dig deeper or pivot to a new topic \
-            from the allowed skills list above. You can choose a single \
-            topic, mix topics and can ask direct questions, scenario \
-            based questions, or conceptual questions.
-
-        ### 3. The `SearchContext` Field - **CRITICAL INSTRUCTION**
-        -   The `SearchContext` field is for **planning ahead**. \
-            It must contain the topic of the question you intend \
-            to ask in your **next turn** (i.e., *after* the user answers\
-            the question you are asking in the current response).
-        -   **IMPORTANT:** The SearchContext MUST be one of the skills \
-            listed above.
-        -   **Example:** If allowed skills are Python, Machine Learning, SQL, \
-            you can only use these topics in SearchContext.
-
-        ---
-
-        ## Context for this Turn
+        ## Interview Details
         -   **User Details:**
             -   Name: {user_name}
             -   Company: {company}
             -   Applying for the Role: {role}
         -   **ALLOWED SKILLS (ONLY ask about these):** {', '.join(skills)}
+
+        ## Context for this Turn
         -   **Available Questions:** `{skill_context}`
         -   **Conversation History:** `{conversation_history}`
         -   **User's Latest Response:** `{user_response}`
-
-        ---
-
-        ## Output Format
-        Generate your response **only** in the following JSON format\
-                Do not add any text before or after the JSON object.
-
-        ```json
-        {{
-            "Response": "Your full response to the user, \
-                including feedback on their last answer and \
-                the new question about one of the allowed \
-                skills: {', '.join(skills)}. Ensure that \
-                the response is in a single paragraph.",
-            "SearchContext": "One of these allowed skills \
-                that you plan to ask \
-                about in your NEXT turn: {', '.join(skills)}",
-            "Evaluation": {{
-                "confidence": "Score from 1-5",
-                "correctness": "Score from 1-5",
-                "completeness": "Score from 1-5"
-            }}
-        }}
         """
         return prompt
 
@@ -88,7 +88,7 @@ class InterviewQuestionResponse(BaseModel):
         None, description="Search context for next question topic selection"
     )
     evaluation: Optional[dict] = Field(
-        None, description="Evaluation metrics from AI response"
+        None, description="Evaluation scores for the user's last answer"
     )
 
 
@@ -104,6 +104,15 @@ class InterviewPresetGenerationRequest(BaseModel):
     )
 
 
+class GeneratedPreset(BaseModel):
+    """Schema Gemini's structured output must follow for one preset."""
+    preset_name: str = Field(..., description="Generated preset name")
+    description: str = Field(..., description="Generated description")
+    company: str = Field(..., description="Generated company name")
+    role: str = Field(..., description="Generated role")
+    skills: List[str] = Field(..., description="Generated skills list")
+
+
 class InterviewPresetGenerationResponse(BaseModel):
     """Model for AI preset generation response."""
     success: bool = \
@@ -1,150 +1,36 @@
 """
 AI service for generating interview presets using Google Gemini API.
 """
+import asyncio
+import functools
 import os
+import anyio
 import google.generativeai as genai
-from typing import Dict, Any, Optional, List
+from google.api_core import exceptions as google_exceptions
+from pydantic import TypeAdapter
+from typing import Dict, Any, Optional, List, Tuple
 import logging
-import json
+import re
 
-logger = logging.getLogger(__name__)
-
-
-class AIPresetService:
-    """Service for AI-powered interview preset generation."""
-
-    def __init__(self):
-        """Initialize the AI Preset service."""
-        self.gemini_api_key = os.getenv("GEMINI_API_KEY")
-        if not self.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY not \
-                             found in environment variables")
-
-        # Configure Gemini API
-        genai.configure(api_key=self.gemini_api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash-lite')
-
-        logger.info("AI Preset service initialized")
-
-    def generate_interview_preset(self,
-                                  description: str,
-                                  user_skills: Optional[List[str]] = None
-                                  ) -> Dict[str, Any]:
-        """
-        Generate an interview preset using Gemini API based on description.
-
-        Args:
-            description: Description of the interview preset to generate
-            user_skills: Optional list of user's existing skills
-
-        Returns:
-            Dictionary containing the generated preset data
-        """
-        try:
-            # Build the prompt
-            prompt = self._build_preset_prompt(description, user_skills)
-
-            # Log the full prompt before calling Gemini API
-            logger.info("=" * 80)
-            logger.info("PRESET GENERATION PROMPT BEING SENT TO GEMINI API:")
-            logger.info("=" * 80)
-            logger.info(prompt)
-            logger.info("=" * 80)
-
-            # Generate response using Gemini
-            response = self.model.generate_content(prompt)
-
-            if response.text:
-                logger.info("Gemini API Response generated successfully")
-
-                # Log the full LLM response
-                logger.info("=" * 80)
-                logger.info("GEMINI API PRESET GENERATION RESPONSE:")
-                logger.info("=" * 80)
-                logger.info(response.text)
-                logger.info("=" * 80)
-
-                # Parse the JSON response
-                try:
-                    cleaned_response = response.text.strip()
-                    if cleaned_response.startswith('```json'):
-                        cleaned_response = cleaned_response[7:]
-                    if cleaned_response.endswith('```'):
-                        cleaned_response = cleaned_response[:-3]
-                    cleaned_response = cleaned_response.strip()
-
-                    response_data = json.loads(cleaned_response)
-
-                    # Extract the components
-                    preset_name = response_data.get('preset_name', '')
-                    description = response_data.get('description', '')
-                    company = response_data.get('company', '')
-                    role = response_data.get('role', '')
-                    skills = response_data.get('skills', [])
-
-                    # Ensure skills is a list
-                    if isinstance(skills, str):
-                        skills = [skill.strip() for skill in
-                                  skills.split(',') if skill.strip()]
-
-                    logger.info(f"Successfully parsed JSON response.\
-                                 Generated preset: {preset_name}")
-
-                    return {
-                        'success': True,
-                        'preset_name': preset_name,
-                        'description': description,
-                        'company': company,
-                        'role': role,
-                        'skills': skills
-                    }
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error parsing JSON response: {e}")
-                    logger.error(f"Raw response: {response.text}")
-
-                    # Fallback response if JSON parsing fails
-                    return {
-                        'success': False,
-                        'error': 'Failed to parse AI response',
-                        'raw_response': response.text
-                    }
-
-            else:
-                logger.warning("Gemini API returned no response text")
-                return {
-                    'success': False,
-                    'error': 'No response from AI service'
-                }
-
-        except Exception as e:
-            logger.error(f"Error generating interview preset: {e}")
-            return {
-                'success': False,
-                'error': f'AI service error: {str(e)}'
-            }
-
-    def _build_preset_prompt(self,
-                             description: str,
-                             user_skills: Optional[List[str]] = None
-                             ) -> str:
-        """
-        Build the prompt for Gemini API to generate interview preset.
-
-        Args:
-            description: Description of the interview preset
-            user_skills: Optional list of user's existing skills
+from .models import GeneratedPreset
+from .preset_batcher import PresetBatcher
+from .preset_cache import get_preset_cache, get_preset_semantic_cache
 
-        Returns:
-            Formatted prompt string
-        """
-
-        user_skills_text = ""
-        if user_skills and len(user_skills) > 0:
-            user_skills_text = \
-                f"User's existing skills: {', '.join(user_skills)}"
+logger = logging.getLogger(__name__)
 
-        prompt = f"""
+# Transient Gemini errors that are retried with exponential backoff
+_RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded
+)
+RETRY_ATTEMPTS = 3
+RETRY_MIN_WAIT = 1
+RETRY_MAX_WAIT = 8
+
+# Static part of the preset generation prompt, set once as the model's
+# system instruction; only the user input is sent with each request
+_SYSTEM_PROMPT = """
         ## Core Objective
         You are an expert interview preparation specialist. \
         Your task is to generate a comprehensive interview \
@@ -162,18 +48,6 @@ class AIPresetService:
         5. **skills**: A comprehensive list of technical \
             and soft skills relevant to this role
 
-        ## Important Notes
-        **You should first check if the skills are present in the \
-        and then generate a comprehensive list of skills.\
-        Do not duplicate skills that are already in the user's \
-        existing skills e.g., if the user has React in his skills \
-        then do not include additional skills like \
-        React (frontend) etc.**
-
-        ## User Input
-        **Description**: {description}
-        {user_skills_text}
-
         ## Instructions
         - **Preset Name**: Create a professional, \
             descriptive name (e.g., "Senior Frontend Developer \
@@ -189,16 +63,13 @@ class AIPresetService:
           - Technical skills (programming languages, frameworks, tools)
           - Soft skills (communication, problem-solving, teamwork)
           - Industry-specific knowledge
-          - If the user has existing skills, prioritize \
-            including those that are relevant
 
         ## Output Format
         Generate your response **only** in the following \
         JSON format. Do not add any text before or after \
         the JSON object.
 
-        ```json
-        {{
+        {
             "preset_name": "Professional preset name",
             "description": "Comprehensive description of the interview preset",
             "company": "Company name",
@@ -206,8 +77,7 @@ class AIPresetService:
             "skills": ["skill1", "skill2", "skill3", \
             "skill4", "skill5", "skill6", "skill7", \
             "skill8"]
-        }}
-        ```
+        }
 
         ## Examples
         If user says "Frontend developer at Google":
@@ -232,6 +102,351 @@ class AIPresetService:
         - skills: ["Python", "TensorFlow", "PyTorch", \
         "Machine Learning", "Data Science", "Statistics", \
         "Deep Learning", "SQL"]
+"""
+
+# Per-request part of the preset generation prompt
+_PROMPT_TEMPLATE = """
+        ## User Input
+        **Description**: {description}
+        {user_skills_text}
+        """
+
+# A generated preset is ~300 tokens of JSON
+MAX_OUTPUT_TOKENS = 512
+
+
+def _generation_config(response_schema: Any,
+                       max_output_tokens: int) -> genai.GenerationConfig:
+    """
+    Build the Gemini generation config for preset requests.
+
+    Structured output makes Gemini return raw JSON matching the schema,
+    without markdown fences. temperature=0 makes responses deterministic,
+    which the response caches rely on: with sampling, a cached preset
+    would be just one of many possible answers for the same input.
+    """
+    return genai.GenerationConfig(
+        temperature=0.0,
+        top_p=1.0,
+        max_output_tokens=max_output_tokens,
+        response_mime_type='application/json',
+        response_schema=response_schema
+    )
+
+
+# Validates batched structured output
+_BATCH_ADAPTER = TypeAdapter(List[GeneratedPreset])
+
+# Parenthetical qualifiers such as the "(frontend)" in "React (frontend)"
+_PARENTHETICAL = re.compile(r'\s*\([^)]*\)')
+
+
+def _normalize_skill(skill: str) -> str:
+    """Normalize a skill name for duplicate detection."""
+    return _PARENTHETICAL.sub('', skill).strip().lower()
+
+
+def _remove_existing_skills(skills: List[str],
+                            user_skills: Optional[List[str]]) -> List[str]:
+    """
+    Drop generated skills the user already has.
+
+    Args:
+        skills: Skills generated by Gemini
+        user_skills: Optional list of user's existing skills
+
+    Returns:
+        Generated skills that are not variants of an existing skill
+    """
+    existing = {_normalize_skill(skill) for skill in user_skills or []}
+    if not existing:
+        return skills
+    return [skill for skill in skills
+            if _normalize_skill(skill) not in existing]
+
+
+class AIPresetService:
+    """Service for AI-powered interview preset generation."""
+
+    def __init__(self):
+        """Initialize the AI Preset service."""
+        self.gemini_api_key = os.getenv("GEMINI_API_KEY")
+        if not self.gemini_api_key:
+            raise ValueError("GEMINI_API_KEY not \
+                             found in environment variables")
+
+        # Configure Gemini API over gRPC so concurrent calls share one
+        # HTTP/2 connection instead of opening new REST connections
+        genai.configure(api_key=self.gemini_api_key, transport='grpc')
+        self.model_name = 'gemini-2.5-flash-lite'
+
+        self.model = genai.GenerativeModel(self.model_name,
+                                           system_instruction=_SYSTEM_PROMPT)
+
+        # Successful responses are cached by (description, user skills),
+        # and by description embedding to catch paraphrases
+        self.cache = get_preset_cache()
+        self.semantic_cache = get_preset_semantic_cache()
+
+        # Generation config for single preset requests
+        self._gen_cfg = _generation_config(GeneratedPreset, MAX_OUTPUT_TOKENS)
+
+        # Concurrent requests are generated together in batched calls
+        self.batcher = PresetBatcher(self._generate_batch)
+
+        logger.info("AI Preset service initialized")
+
+    async def generate_interview_preset(self,
+                                        description: str,
+                                        user_skills: Optional[List[str]] = None
+                                        ) -> Dict[str, Any]:
+        """
+        Generate an interview preset using Gemini API based on description.
+
+        Concurrent requests are collected by the batcher and generated in a
+        single Gemini call.
+
+        Args:
+            description: Description of the interview preset to generate
+            user_skills: Optional list of user's existing skills
+
+        Returns:
+            Dictionary containing the generated preset data
+        """
+        # Identical requests are served from the response cache
+        cached_result = self.cache.get(description, user_skills)
+        if cached_result is not None:
+            logger.info("Serving interview preset from response cache")
+            return cached_result
+
+        # Paraphrased descriptions are served from the semantic cache;
+        # the embedding and Qdrant calls are blocking
+        result = await anyio.to_thread.run_sync(self.semantic_cache.get,
+                                                description)
+        if result is None:
+            result = await self.batcher.submit((description, user_skills))
+            if result.get('success'):
+                await anyio.to_thread.run_sync(self.semantic_cache.set,
+                                               description, result)
+
+        if result.get('success'):
+            # Deduplicate against the user's skills here rather than in
+            # the prompt, where the model does it unreliably
+            result['skills'] = _remove_existing_skills(result['skills'],
+                                                       user_skills)
+            self.cache.set(description, user_skills, result)
+
+        return result
+
+    async def aclose(self) -> None:
+        """Stop the request batcher."""
+        await self.batcher.close()
+
+    async def _generate_content(self, prompt: str,
+                                generation_config: genai.GenerationConfig):
+        """
+        Call Gemini with the static system prompt.
+
+        Rate limiting, unavailability and timeouts are retried with
+        exponential backoff; other API errors are raised immediately.
+        """
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                # The genai SDK call is blocking, so run it in the worker
+                # thread pool to keep the event loop free for other requests
+                return await anyio.to_thread.run_sync(functools.partial(
+                    self.model.generate_content, prompt,
+                    generation_config=generation_config
+                ))
+            except _RETRYABLE_ERRORS as e:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                delay = min(RETRY_MIN_WAIT * 2 ** (attempt - 1),
+                            RETRY_MAX_WAIT)
+                logger.warning("Gemini call failed (%s), retrying in %ds",
+                               e, delay)
+                await asyncio.sleep(delay)
+
+    async def _generate_batch(self,
+                              payloads: List[Tuple[str, Optional[List[str]]]]
+                              ) -> List[Dict[str, Any]]:
+        """
+        Generate presets for several requests with a single Gemini call.
+
+        Falls back to one call per request if the batched response cannot
+        be parsed. API errors, which a retry per request would only
+        repeat, are returned to every request.
+
+        Args:
+            payloads: List of (description, user_skills) tuples
+
+        Returns:
+            List of preset results in the same order as payloads
+        """
+        if len(payloads) == 1:
+            return [await self._generate_single(*payloads[0])]
+
+        try:
+            response = await self._generate_content(
+                self._build_batch_prompt(payloads),
+                _generation_config(List[GeneratedPreset],
+                                   MAX_OUTPUT_TOKENS * len(payloads))
+            )
+        except google_exceptions.GoogleAPIError as e:
+            logger.error("Error generating %d interview presets: %s",
+                         len(payloads), e)
+            return [{'success': False, 'error': f'AI service error: {str(e)}'}
+                    for _ in payloads]
+
+        try:
+            presets = _BATCH_ADAPTER.validate_json(response.text)
+
+            if len(presets) != len(payloads):
+                raise ValueError(
+                    f"Expected {len(payloads)} presets in batch response"
+                )
+
+            logger.info("Generated %d presets in one batch", len(payloads))
+            return [self._parse_preset_data(preset) for preset in presets]
+
+        except (ValueError, KeyError) as e:
+            logger.warning("Batched preset response could not be parsed, "
+                           "falling back to single calls: %s", e)
+            return list(await asyncio.gather(
+                *(self._generate_single(description, user_skills)
+                  for description, user_skills in payloads)
+            ))
+
+    async def _generate_single(self,
+                               description: str,
+                               user_skills: Optional[List[str]] = None
+                               ) -> Dict[str, Any]:
+        """
+        Generate a single interview preset with its own Gemini call.
+
+        Args:
+            description: Description of the interview preset to generate
+            user_skills: Optional list of user's existing skills
+
+        Returns:
+            Dictionary containing the generated preset data
+        """
+        # Build the prompt
+        prompt = self._build_preset_prompt(description, user_skills)
+
+        # Log the full prompt only when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("PRESET GENERATION PROMPT:\n%s", prompt)
+
+        try:
+            # Generate response using Gemini
+            response = await self._generate_content(prompt, self._gen_cfg)
+        except google_exceptions.GoogleAPIError as e:
+            logger.error("Error generating interview preset: %s", e)
+            return {
+                'success': False,
+                'error': f'AI service error: {str(e)}'
+            }
+
+        try:
+            if not response.text:
+                logger.warning("Gemini API returned no response text")
+                return {
+                    'success': False,
+                    'error': 'No response from AI service'
+                }
+
+            logger.info("Gemini API Response generated successfully")
+
+            # Log the full LLM response only when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("PRESET GENERATION RESPONSE:\n%s",
+                             response.text)
+
+            # Structured output is raw JSON matching GeneratedPreset
+            return self._parse_preset_data(
+                GeneratedPreset.model_validate_json(response.text)
+            )
+
+        except (ValueError, KeyError) as e:
+            # Blocked responses have no text and schema violations raise
+            # pydantic's ValidationError, both are ValueErrors
+            logger.error("Error parsing preset response: %s", e)
+            return {
+                'success': False,
+                'error': 'Failed to parse AI response'
+            }
+
+    def _parse_preset_data(self, preset: GeneratedPreset) -> Dict[str, Any]:
+        """
+        Build the service result for a preset generated by Gemini.
+
+        Args:
+            preset: Preset parsed from Gemini's structured output
+
+        Returns:
+            Dictionary containing the generated preset data
+        """
+        logger.info("Successfully parsed JSON response. "
+                    "Generated preset: %s", preset.preset_name)
+
+        # Trim, drop blank entries and dedupe, keeping Gemini's order
+        skills = list(dict.fromkeys(
+            skill.strip() for skill in preset.skills if skill.strip()
+        ))
+
+        return {'success': True, **preset.model_dump(), 'skills': skills}
+
+    def _build_batch_prompt(self,
+                            payloads: List[Tuple[str, Optional[List[str]]]]
+                            ) -> str:
+        """
+        Build a prompt that asks for one preset per request, in order.
+
+        Args:
+            payloads: List of (description, user_skills) tuples
+
+        Returns:
+            Formatted prompt string
+        """
+        inputs = "\n".join(
+            f"### Input {i}\n"
+            f"{self._build_preset_prompt(description, user_skills)}"
+            for i, (description, user_skills) in enumerate(payloads, 1)
+        )
+
+        prompt = f"""
+        ## Batch Request
+        Generate one interview preset for each of the {len(payloads)} \
+        inputs below. Return a JSON array of {len(payloads)} preset \
+        objects in the same order as the inputs.
+
+        {inputs}
         """
 
         return prompt
+
+    def _build_preset_prompt(self,
+                             description: str,
+                             user_skills: Optional[List[str]] = None
+                             ) -> str:
+        """
+        Build the per-request prompt for Gemini API to generate an
+        interview preset. The instructions live in _SYSTEM_PROMPT.
+
+        Args:
+            description: Description of the interview preset
+            user_skills: Optional list of user's existing skills
+
+        Returns:
+            Formatted prompt string
+        """
+        user_skills_text = ""
+        if user_skills:
+            user_skills_text = \
+                f"User's existing skills: {', '.join(user_skills)}"
+
+        return _PROMPT_TEMPLATE.format_map({
+            'description': description,
+            'user_skills_text': user_skills_text
+        })
@@ -0,0 +1,115 @@
+"""
+Micro-batcher for AI preset generation requests.
+Collects requests arriving within a short window and hands them to a
+single batched Gemini call, fanning the results back to each caller.
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX = int(os.getenv("PRESET_BATCH_MAX", "8"))
+BATCH_WINDOW_MS = int(os.getenv("PRESET_BATCH_WINDOW_MS", "50"))
+
+
+class PresetBatcher:
+    """Batches concurrent preset generation requests."""
+
+    def __init__(self,
+                 batch_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+                 batch_max: int = BATCH_MAX,
+                 batch_window_ms: int = BATCH_WINDOW_MS):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_fn: Coroutine function that takes a list of payloads and
+                returns a list of results in the same order
+            batch_max: Maximum number of requests per batch
+            batch_window_ms: How long to wait for more requests after the
+                first one arrives
+        """
+        self.batch_fn = batch_fn
+        self.batch_max = batch_max
+        self.batch_window = batch_window_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    def _ensure_worker(self) -> None:
+        """Start the collector task on the running event loop."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(
+                self._collect()
+            )
+
+    async def submit(self, payload: Any) -> Any:
+        """
+        Queue a payload and wait for its result.
+
+        Args:
+            payload: Request payload passed to batch_fn
+
+        Returns:
+            The result batch_fn produced for this payload
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _collect(self) -> None:
+        """Group queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+
+            while len(batch) < self.batch_max:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without waiting so the next batch can be collected
+            # while this one is being generated
+            task = loop.create_task(self._dispatch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]
+                        ) -> None:
+        """Run one batch and resolve the waiting futures."""
+        logger.info("Dispatching preset batch of %d request(s)", len(batch))
+        try:
+            results = await self.batch_fn([payload for payload, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the collector task and wait for in-flight batches."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
@@ -0,0 +1,328 @@
+"""
+Response caches for AI-generated interview presets.
+Avoids calling Gemini again for a description/skills combination that
+was already generated recently, or for a paraphrase of a description
+that was.
+"""
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    PayloadSchemaType,
+    PointStruct,
+    Range,
+    VectorParams
+)
+
+from ..utils.qdrant_service import QdrantVectorService, get_qdrant_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = int(os.getenv("PRESET_CACHE_TTL_SECONDS", "86400"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("PRESET_CACHE_MAX_ENTRIES", "1024"))
+SIMILARITY_THRESHOLD = float(
+    os.getenv("PRESET_SEMANTIC_CACHE_THRESHOLD", "0.92")
+)
+SWEEP_INTERVAL_SECONDS = int(
+    os.getenv("PRESET_SEMANTIC_CACHE_SWEEP_SECONDS", "3600")
+)
+# Number of description embeddings kept by each semantic cache
+EMBED_CACHE_SIZE = 256
+
+
+class PresetResponseCache:
+    """In-process TTL/LRU cache for generated preset responses."""
+
+    def __init__(self,
+                 ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the preset response cache.
+
+        Args:
+            ttl_seconds: How long a cached response stays valid
+            max_entries: Maximum number of cached responses
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = \
+            OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        """Hash a normalized cache key component."""
+        return hashlib.md5(value.encode('utf-8')).hexdigest()
+
+    def _key(self, description: str,
+             user_skills: Optional[List[str]] = None) -> str:
+        """
+        Build the cache key for a description and set of user skills.
+
+        The description hash comes first so that every entry for a
+        description can be invalidated regardless of the skills.
+        """
+        skills = ','.join(sorted(s.strip().lower() for s in user_skills or []))
+        return (f"preset:{self._hash(description.strip().lower())}"
+                f":{self._hash(skills)}")
+
+    def get(self, description: str,
+            user_skills: Optional[List[str]] = None
+            ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached preset response.
+
+        Args:
+            description: Description of the interview preset
+            user_skills: Optional list of user's existing skills
+
+        Returns:
+            Copy of the cached response, or None on a miss
+        """
+        key = self._key(description, user_skills)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return dict(value)
+
+    def set(self, description: str,
+            user_skills: Optional[List[str]],
+            value: Dict[str, Any]) -> None:
+        """
+        Store a preset response in the cache.
+
+        Args:
+            description: Description of the interview preset
+            user_skills: Optional list of user's existing skills
+            value: Generated preset response
+        """
+        key = self._key(description, user_skills)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds,
+                                  dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, description: str) -> int:
+        """
+        Remove every cached response for a description.
+
+        Args:
+            description: Description of the interview preset
+
+        Returns:
+            Number of removed entries
+        """
+        prefix = f"preset:{self._hash(description.strip().lower())}:"
+        with self._lock:
+            stale_keys = [key for key in self._entries
+                          if key.startswith(prefix)]
+            for key in stale_keys:
+                del self._entries[key]
+
+        logger.info("Invalidated %d cached presets", len(stale_keys))
+        return len(stale_keys)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class PresetSemanticCache:
+    """
+    Qdrant-backed cache that matches paraphrased preset descriptions.
+
+    Results are stored without the user-skill filtering applied, since a
+    paraphrased description can come from a user with different skills.
+    """
+
+    collection_name = "preset_cache"
+
+    def __init__(self,
+                 vector_service: Optional[QdrantVectorService] = None,
+                 threshold: float = SIMILARITY_THRESHOLD,
+                 ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the semantic preset cache.
+
+        Args:
+            vector_service: Vector service used for embeddings and storage,
+                defaults to the shared Qdrant service
+            threshold: Minimum cosine similarity for a cache hit
+            ttl_seconds: How long a cached response stays valid
+        """
+        self.vector_service = vector_service or get_qdrant_service()
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._ready = False
+        self._last_sweep = time.time()
+        # Recent description embeddings; built per instance, since
+        # lru_cache on the method would share one cache across instances
+        # and keep them alive
+        self._embed = functools.lru_cache(maxsize=EMBED_CACHE_SIZE)(
+            self._encode
+        )
+
+    @property
+    def client(self):
+        """Qdrant client of the underlying vector service."""
+        if self.vector_service is None:
+            return None
+        return self.vector_service.qdrant_client
+
+    def _ensure_collection(self) -> bool:
+        """Create the cache collection on first use."""
+        if self._ready:
+            return True
+        if self.client is None:
+            return False
+
+        if not self.client.collection_exists(self.collection_name):
+            self.client.create_collection(
+                collection_name=self.collection_name,
+                vectors_config=VectorParams(
+                    size=self.vector_service.embedding_dim,
+                    distance=Distance.COSINE
+                )
+            )
+            # Lookups and sweeps filter on the expiry time
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name='expires_at',
+                field_schema=PayloadSchemaType.FLOAT
+            )
+            logger.info("Created collection: %s", self.collection_name)
+
+        self._ready = True
+        return True
+
+    def _encode(self, description: str) -> np.ndarray:
+        """Embed a normalized description; cached per instance by _embed."""
+        return self.vector_service.generate_embedding(description)
+
+    def get(self, description: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a preset generated for a similar description.
+
+        Args:
+            description: Description of the interview preset
+
+        Returns:
+            Copy of the cached response, or None on a miss
+        """
+        try:
+            if not self._ensure_collection():
+                return None
+
+            hits = self.client.search(
+                collection_name=self.collection_name,
+                query_vector=self._embed(description.strip().lower()),
+                query_filter=Filter(must=[
+                    FieldCondition(key='expires_at',
+                                   range=Range(gt=time.time()))
+                ]),
+                limit=1,
+                score_threshold=self.threshold,
+                with_payload=True
+            )
+            if not hits:
+                return None
+
+            logger.info("Semantic preset cache hit (similarity %.3f)",
+                        hits[0].score)
+            return dict(hits[0].payload['result'])
+
+        except Exception as e:
+            logger.warning("Semantic preset cache lookup failed: %s", e)
+            return None
+
+    def set(self, description: str, value: Dict[str, Any]) -> None:
+        """
+        Store a preset response for a description.
+
+        Args:
+            description: Description of the interview preset
+            value: Generated preset response
+        """
+        try:
+            if not self._ensure_collection():
+                return
+
+            normalized = description.strip().lower()
+            now = time.time()
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=[PointStruct(
+                    id=hashlib.md5(normalized.encode('utf-8')).hexdigest(),
+                    vector=self._embed(normalized).tolist(),
+                    payload={
+                        'description': description,
+                        'result': dict(value),
+                        'expires_at': now + self.ttl_seconds
+                    }
+                )]
+            )
+
+            if now - self._last_sweep > SWEEP_INTERVAL_SECONDS:
+                self._last_sweep = now
+                self.sweep()
+
+        except Exception as e:
+            logger.warning("Failed to store preset in semantic cache: %s", e)
+
+    def sweep(self) -> None:
+        """Delete expired responses from the cache collection."""
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(filter=Filter(must=[
+                FieldCondition(key='expires_at',
+                               range=Range(lte=time.time()))
+            ]))
+        )
+        logger.info("Swept expired presets from %s", self.collection_name)
+
+
+# Global cache instances shared by all preset service instances
+_preset_cache = None
+_semantic_cache = None
+
+
+def get_preset_cache() -> PresetResponseCache:
+    """Get or create the global preset response cache."""
+    global _preset_cache
+
+    if _preset_cache is None:
+        _preset_cache = PresetResponseCache()
+
+    return _preset_cache
+
+
+def get_preset_semantic_cache() -> PresetSemanticCache:
+    """Get or create the global semantic preset cache."""
+    global _semantic_cache
+
+    if _semantic_cache is None:
+        _semantic_cache = PresetSemanticCache()
+
+    return _semantic_cache
@@ -1,9 +1,12 @@
 """
 FastAPI routes for interview presets.
 """
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+import json
 import logging
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from ..auth.utils import get_current_user
 from ..database.database_preset_functions import (
     get_user_interview_presets,
@@ -23,11 +26,38 @@ from .models import (
     InterviewPresetGenerationRequest,
     InterviewPresetGenerationResponse
 )
+from ..utils.updation_service import get_updation_service
+from .ai_service import AIInterviewService
+from .preset_ai_service import AIPresetService
 
 router = APIRouter(prefix="/interview", tags=["interview"])
 logger = logging.getLogger(__name__)
 
 
+def get_ai_service(request: Request) -> AIInterviewService:
+    """Get the shared AI interview service created at startup."""
+    ai_service = getattr(request.app.state, 'ai_service', None)
+    if ai_service is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="AI service configuration error. \
+            Please check environment variables."
+        )
+    return ai_service
+
+
+def get_ai_preset_service(request: Request) -> AIPresetService:
+    """Get the shared AI preset service created at startup."""
+    ai_preset_service = getattr(request.app.state, 'ai_preset_service', None)
+    if ai_preset_service is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="AI preset service configuration error. \
+            Please check environment variables."
+        )
+    return ai_preset_service
+
+
 @router.get("/presets", response_model=InterviewPresetListResponse)
 async def get_interview_presets(
     current_user: Optional[str] = Depends(get_current_user)
@@ -42,7 +72,8 @@ async def get_interview_presets(
     try:
         presets = get_user_interview_presets(current_user)
         return InterviewPresetListResponse(
-            presets=[InterviewPresetResponse(**preset) for preset in presets],
+            presets=[InterviewPresetResponse.model_construct(**preset)
+                     for preset in presets],
             total=len(presets)
         )
     except RuntimeError as e:
@@ -52,7 +83,8 @@ async def get_interview_presets(
         )
 
 
-@router.post("/presets", response_model=InterviewPresetResponse)
+@router.post("/presets", response_model=InterviewPresetResponse,
+             response_model_exclude_unset=True)
 async def create_preset(
     preset_data: InterviewPresetCreate,
     current_user: Optional[str] = Depends(get_current_user)
@@ -75,10 +107,11 @@ async def create_preset(
         # Create the preset
         created_preset = create_interview_preset(
             user_email=current_user,
-            preset_data=preset_data.dict()
+            preset_data=preset_data.model_dump(exclude_unset=True)
         )
 
-        return InterviewPresetResponse(**created_preset)
+        # The database layer is trusted, skip re-validating its output
+        return InterviewPresetResponse.model_construct(**created_preset)
 
     except RuntimeError as e:
         raise HTTPException(
@@ -92,7 +125,8 @@ async def create_preset(
         )
 
 
-@router.get("/presets/{preset_id}", response_model=InterviewPresetResponse)
+@router.get("/presets/{preset_id}", response_model=InterviewPresetResponse,
+            response_model_exclude_unset=True)
 async def get_preset(
     preset_id: int,
     current_user: Optional[str] = Depends(get_current_user)
@@ -112,7 +146,7 @@ async def get_preset(
                 detail="Interview preset not found"
             )
 
-        return InterviewPresetResponse(**preset)
+        return InterviewPresetResponse.model_construct(**preset)
 
     except RuntimeError as e:
         raise HTTPException(
@@ -121,7 +155,8 @@ async def get_preset(
         )
 
 
-@router.put("/presets/{preset_id}", response_model=InterviewPresetResponse)
+@router.put("/presets/{preset_id}", response_model=InterviewPresetResponse,
+            response_model_exclude_unset=True)
 async def update_preset(
     preset_id: int,
     preset_data: InterviewPresetUpdate,
@@ -146,7 +181,7 @@ async def update_preset(
         updated_preset = update_interview_preset(
             user_email=current_user,
             preset_id=preset_id,
-            preset_data=preset_data.dict()
+            preset_data=preset_data.model_dump(exclude_unset=True)
         )
 
         if not updated_preset:
@@ -155,7 +190,7 @@ async def update_preset(
                 detail="Interview preset not found"
             )
 
-        return InterviewPresetResponse(**updated_preset)
+        return InterviewPresetResponse.model_construct(**updated_preset)
 
     except RuntimeError as e:
         raise HTTPException(
@@ -208,11 +243,42 @@ async def delete_preset(
         )
 
 
+def _prepare_question_inputs(request: InterviewQuestionRequest,
+                             current_user: str,
+                             ai_service: AIInterviewService
+                             ) -> Tuple[Dict[str, Any], str]:
+    """
+    Build the user details and conversation history for the AI service.
+
+    Returns:
+        Tuple of (user details with tracking info, formatted history)
+    """
+    # Convert conversation history to the format expected by AI service
+    conversation_messages = []
+    for msg in request.conversation_history:
+        conversation_messages.append({
+            'role': msg.role,
+            'content': msg.content
+        })
+
+    # Format conversation history
+    conversation_history = ai_service.\
+        format_conversation_history(conversation_messages)
+
+    # Enhance user details with tracking information
+    enhanced_user_details = request.user_details.copy()
+    enhanced_user_details['userId'] = current_user
+    enhanced_user_details['sessionId'] = getattr(request, 'session_id', '')
+
+    return enhanced_user_details, conversation_history
+
+
 # AI Interview Route
 @router.post("/generate-question", response_model=InterviewQuestionResponse)
 async def generate_interview_question(
     request: InterviewQuestionRequest,
-    current_user: Optional[str] = Depends(get_current_user)
+    current_user: Optional[str] = Depends(get_current_user),
+    ai_service: AIInterviewService = Depends(get_ai_service)
 ):
     """Generate an interview question using AI."""
     if not current_user:
@@ -222,32 +288,15 @@ async def generate_interview_question(
         )
 
     try:
-        # Initialize AI service - import here to avoid circular imports
-        from .ai_service import AIInterviewService
-
-        # Initialize AI service
-        ai_service = AIInterviewService()
-
-        # Convert conversation history to the format expected by AI service
-        conversation_messages = []
-        for msg in request.conversation_history:
-            conversation_messages.append({
-                'role': msg.role,
-                'content': msg.content
-            })
-
-        # Format conversation history
-        conversation_history = ai_service.\
-            format_conversation_history(conversation_messages)
-
-        # Enhance user details with tracking information
-        enhanced_user_details = request.user_details.copy()
-        enhanced_user_details['userId'] = current_user
-        enhanced_user_details['sessionId'] = getattr(request, 'session_id', '')
-
-        # Generate question
-        result = ai_service.generate_interview_question(
-            user_details=enhanced_user_details,
+        user_details, conversation_history = _prepare_question_inputs(
+            request, current_user, ai_service
+        )
+
+        # Generate question in the worker thread pool - the vector search,
+        # embedding and Gemini calls are all blocking
+        result = await run_in_threadpool(
+            ai_service.generate_interview_question,
+            user_details=user_details,
             skills=request.skills,
             conversation_history=conversation_history,
             search_context=request.search_context,
@@ -263,20 +312,6 @@ async def generate_interview_question(
             evaluation=result.get('evaluation')
         )
 
-    except ImportError as e:
-        logger.error(f"Failed to import AI service: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="AI service not available. \
-            Please check Google Generative AI installation."
-        )
-    except ValueError as e:
-        logger.error(f"Configuration error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="AI service configuration error. \
-            Please check environment variables."
-        )
     except Exception as e:
         logger.error(f"Error generating interview question: {e}")
         raise HTTPException(
@@ -285,12 +320,57 @@ async def generate_interview_question(
         )
 
 
+@router.post("/generate-question/stream")
+async def stream_interview_question(
+    request: InterviewQuestionRequest,
+    current_user: Optional[str] = Depends(get_current_user),
+    ai_service: AIInterviewService = Depends(get_ai_service)
+):
+    """
+    Generate an interview question using AI, streamed as server-sent events.
+
+    Emits a "chunk" event for each piece of generated text and a final
+    "result" event with the same payload as /generate-question.
+    """
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+
+    user_details, conversation_history = _prepare_question_inputs(
+        request, current_user, ai_service
+    )
+
+    async def event_stream():
+        async for event, payload in ai_service.stream_interview_question(
+            user_details=user_details,
+            skills=request.skills,
+            conversation_history=conversation_history,
+            search_context=request.search_context,
+            store_questions=True
+        ):
+            if event == 'result':
+                payload = InterviewQuestionResponse(
+                    question=payload['question'],
+                    success=payload['success'],
+                    message="Question generated successfully"
+                    if payload['success'] else "Failed to generate question",
+                    search_context=payload.get('search_context'),
+                    evaluation=payload.get('evaluation')
+                ).model_dump(mode='json')
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 # AI Preset Generation Route
 @router.post("/generate-preset",
              response_model=InterviewPresetGenerationResponse)
 async def generate_interview_preset(
     request: InterviewPresetGenerationRequest,
-    current_user: Optional[str] = Depends(get_current_user)
+    current_user: Optional[str] = Depends(get_current_user),
+    ai_preset_service: AIPresetService = Depends(get_ai_preset_service)
 ):
     """Generate an interview preset using AI."""
     if not current_user:
@@ -300,34 +380,14 @@ async def generate_interview_preset(
         )
 
     try:
-        # Initialize AI preset service - import here to avoid circular imports
-        from .preset_ai_service import AIPresetService
-
-        # Initialize AI preset service
-        ai_preset_service = AIPresetService()
-
         # Generate preset
-        result = ai_preset_service.generate_interview_preset(
+        result = await ai_preset_service.generate_interview_preset(
             description=request.description,
             user_skills=request.user_skills
         )
 
         return InterviewPresetGenerationResponse(**result)
 
-    except ImportError as e:
-        logger.error(f"Failed to import AI preset service: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="AI preset service not available. \
-            Please check Google Generative AI installation."
-        )
-    except ValueError as e:
-        logger.error(f"Configuration error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="AI preset service configuration error. \
-            Please check environment variables."
-        )
     except Exception as e:
         logger.error(f"Error generating interview preset: {e}")
         raise HTTPException(
@@ -342,7 +402,8 @@ async def store_question_manually(
     question: str,
     answer: str = "",
     skills: Optional[list] = None,
-    current_user: Optional[str] = Depends(get_current_user)
+    current_user: Optional[str] = Depends(get_current_user),
+    ai_service: AIInterviewService = Depends(get_ai_service)
 ):
     """Manually store a question-answer pair in the vector database."""
     if not current_user:
@@ -352,10 +413,8 @@ async def store_question_manually(
         )
 
     try:
-        from .ai_service import AIInterviewService
-
-        ai_service = AIInterviewService()
-        result = ai_service.store_question_manually(
+        result = await run_in_threadpool(
+            ai_service.store_question_manually,
             question=question,
             answer=answer,
             skills=skills or [],
@@ -388,8 +447,6 @@ async def get_updation_service_stats(
         )
 
     try:
-        from ..utils.updation_service import get_updation_service
-
         updation_service = get_updation_service()
         stats = updation_service.get_service_stats()
 
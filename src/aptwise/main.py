@@ -1,24 +1,21 @@
 """
 Main FastAPI application for AptWise backend.
 """
-import sys
+import logging
 import os
-import time
+from contextlib import asynccontextmanager
 from typing import Optional
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Depends, status, Request
+from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
-# Load environment variables first, before any other imports
+# Load environment variables first, before any other imports - the config
+# modules read them at import time
 load_dotenv()
 
-# Debug: Print environment loading status
-print("Environment Variables Status:")
-print(f"LINKEDIN_CLIENT_ID: {os.getenv('LINKEDIN_CLIENT_ID')}")
-linkedin_secret = os.getenv('LINKEDIN_CLIENT_SECRET')
-print(f"LINKEDIN_CLIENT_SECRET: {'Present' if linkedin_secret else 'Missing'}")
-print(f"LINKEDIN_REDIRECT_URI: {os.getenv('LINKEDIN_REDIRECT_URI')}")
+# Configure logging for the application's modules once, at the entry point
+logging.basicConfig(level=logging.INFO)
 
 from .auth.routes import router as auth_router  # noqa: E402
 from .auth.utils import get_current_user  # noqa: E402
@@ -26,28 +23,60 @@ from .config import get_session  # noqa: E402
 from .vector_search.routes import router as vector_router  # noqa: E402
 from .interview.routes import router as interview_router  # noqa: E402
 from .evaluation.routes import router as evaluation_router  # noqa: E402
+from .interview.ai_service import AIInterviewService  # noqa: E402
+from .interview.preset_ai_service import AIPresetService  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def _create_service(service_class):
+    """Instantiate a shared service, returning None if it is misconfigured."""
+    try:
+        return service_class()
+    except Exception:
+        logger.exception("Failed to initialize %s", service_class.__name__)
+        return None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Check the database and create the shared AI services on startup."""
+    if os.getenv("DEBUG"):
+        # Debug: Print environment loading status
+        print("Environment Variables Status:")
+        print(f"LINKEDIN_CLIENT_ID: {os.getenv('LINKEDIN_CLIENT_ID')}")
+        linkedin_secret = os.getenv('LINKEDIN_CLIENT_SECRET')
+        print("LINKEDIN_CLIENT_SECRET: "
+              f"{'Present' if linkedin_secret else 'Missing'}")
+        print(f"LINKEDIN_REDIRECT_URI: {os.getenv('LINKEDIN_REDIRECT_URI')}")
+
+    # Check database connection; failing here aborts startup
+    session = get_session()
+    if not session:
+        raise RuntimeError("Failed to connect to PostgreSQL database. "
+                           "Application will exit.")
+    session.close()
+
+    app.state.ai_preset_service = _create_service(AIPresetService)
+    app.state.ai_service = _create_service(AIInterviewService)
+    yield
+    if app.state.ai_preset_service is not None:
+        await app.state.ai_preset_service.aclose()
+
 
 app = FastAPI(
     title="AptWise Backend API",
     description="Backend API for AptWise application with authentication "
                 "and LinkedIn OAuth",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
-# Add middleware to log all requests (for debugging)
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    print(f"🌐 {request.method} {request.url}")
-    response = await call_next(request)
-    print(f"📤 Response: {response.status_code}")
-    return response
-
-
 # Add CORS middleware for frontend integration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
+    allow_origins=frozenset([
         "http://localhost:3000",
         "http://localhost:5173",
         "http://localhost:5174",
@@ -55,21 +84,13 @@ app.add_middleware(
         "http://127.0.0.1:3000",
         "http://127.0.0.1:5173",
         "http://127.0.0.1:5174"
-    ],   # Add your frontend URLs
+    ]),   # Add your frontend URLs
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-# Check database connection
-session = get_session()
-if not session:
-    print("ERROR: Failed to connect to PostgreSQL database. "
-          "Application will exit.")
-    # Add a small delay before exiting to allow error messages to be printed
-    time.sleep(1)
-    sys.exit(1)
-
 # Note: Tables are now managed by Alembic migrations
 
 # Include authentication routes
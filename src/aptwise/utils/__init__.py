@@ -8,6 +8,8 @@ from .qdrant_service import (
     initialize_vector_database
 )
 
+from .embedding_cache import EmbeddingCache
+
 from .updation_service import (
     QuestionUpdationService,
     get_updation_service,
@@ -18,6 +20,7 @@ __all__ = [
     "QdrantVectorService",
     "get_qdrant_service",
     "initialize_vector_database",
+    "EmbeddingCache",
     "QuestionUpdationService",
     "get_updation_service",
     "check_and_store_interview_question"
@@ -0,0 +1,102 @@
+"""
+Persistent embedding cache for AptWise backend.
+Stores sentence embeddings on disk keyed by a hash of the embedded text,
+so unchanged questions are not re-encoded on every cold start.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "./data/.emb_cache")
+
+# SQLite limits the number of parameters in a single statement
+_MAX_PARAMS = 500
+
+
+class EmbeddingCache:
+    """SQLite-backed store of float32 embeddings keyed by content hash."""
+
+    def __init__(self, model_name: str, cache_dir: str = EMBEDDING_CACHE_DIR):
+        """
+        Open (or create) the cache file for a model.
+
+        Each model gets its own file, so switching models never returns
+        embeddings from a different vector space. If the file cannot be
+        opened the cache is disabled and every lookup misses.
+
+        Args:
+            model_name: Name of the sentence transformer model
+            cache_dir: Directory holding the cache files
+        """
+        self.path = os.path.join(cache_dir,
+                                 f"{model_name.replace('/', '_')}.sqlite3")
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings "
+                    "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+                )
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Embedding cache disabled, cannot open %s: %s",
+                           self.path, e)
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            keys: Content hashes to look up
+
+        Returns:
+            Mapping of the keys that were found to their embeddings
+        """
+        found = {}
+        if self._conn is None:
+            return found
+        try:
+            with self._lock:
+                for start in range(0, len(keys), _MAX_PARAMS):
+                    chunk = keys[start:start + _MAX_PARAMS]
+                    rows = self._conn.execute(
+                        "SELECT key, vector FROM embeddings WHERE key IN "
+                        f"({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    for key, vector in rows:
+                        found[key] = np.frombuffer(vector, dtype=np.float32)
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache lookup failed: %s", e)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        """
+        Store embeddings in the cache.
+
+        Args:
+            items: Pairs of (content hash, embedding)
+        """
+        if self._conn is None:
+            return
+        rows = [(key, np.asarray(vector, dtype=np.float32).tobytes())
+                for key, vector in items]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) "
+                    "VALUES (?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache write failed: %s", e)
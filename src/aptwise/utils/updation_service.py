@@ -3,24 +3,56 @@ Updation Service for managing question storage in vector database.
 Handles checking and storing of LLM-generated interview questions.
 """
 
+import functools
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
-import hashlib
-from .qdrant_service import QdrantVectorService
+import numpy as np
+from .qdrant_service import (
+    QdrantVectorService,
+    _content_digest,
+    get_qdrant_service
+)
 
 logger = logging.getLogger(__name__)
 
+# Number of question embeddings kept for repeated existence checks
+EMBED_CACHE_SIZE = 4096
+# Number of normalized question strings kept for repeated comparisons
+NORMALIZE_CACHE_SIZE = 8192
+# Concurrent Qdrant searches issued by batch_check_and_store
+SEARCH_CONCURRENCY = 2
+
 
 class QuestionUpdationService:
     """Service for managing question storage and updates in vector database."""
 
     def __init__(self):
         """Initialize the updation service."""
-        self.vector_service = QdrantVectorService()
+        self._vector_service: Optional[QdrantVectorService] = None
+        # Per-instance LRU of question embeddings for repeated checks,
+        # keyed by normalized question
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embeddings_lock = threading.Lock()
         self.similarity_threshold = 0.85
         # Threshold for considering questions similar
         logger.info("Question Updation Service initialized")
 
+    @property
+    def vector_service(self) -> Optional[QdrantVectorService]:
+        """
+        Shared vector service, created on first use.
+
+        Importing or constructing this service does not load the
+        embedding model; the first check or store does.
+        """
+        if self._vector_service is None:
+            self._vector_service = get_qdrant_service()
+        return self._vector_service
+
     def _generate_question_id(self, question: str, answer: str = "") -> str:
         """
         Generate a deterministic ID for a question-answer pair.
@@ -32,36 +64,83 @@ class QuestionUpdationService:
         Returns:
             Deterministic string ID
         """
+        # Same digest index_documents uses for point IDs
+        return _content_digest(question.strip(), answer.strip()).hex()
+
+    @staticmethod
+    def _legacy_question_id(question: str, answer: str = "") -> str:
+        """
+        Generate the MD5-based ID used before the switch to BLAKE2b.
+
+        Points indexed before the switch still carry these IDs; remove
+        once the collection has been reindexed.
+        """
         content = f"{question.strip()}|{answer.strip()}"
         return hashlib.md5(content.encode('utf-8')).hexdigest()
 
-    def _normalize_question(self, question: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def _normalize_question(question: str) -> str:
         """
         Normalize question text for comparison.
 
+        Cached, since the same stored questions come back from many
+        searches across a batch.
+
         Args:
             question: Raw question text
 
         Returns:
             Normalized question text
         """
-        # Remove extra whitespace, convert to
-        # lowercase, remove punctuation at the end
-        normalized = question.strip().lower()
-        # Remove common trailing punctuation
-        while normalized and normalized[-1] in '?.!':
-            normalized = normalized[:-1]
-        return normalized.strip()
+        # Remove extra whitespace, convert to lowercase and remove
+        # common trailing punctuation
+        return question.strip().lower().rstrip('?.!').rstrip()
+
+    def _embed_question(self, question: str) -> np.ndarray:
+        """
+        Embed a question, reusing the embedding of an earlier check.
+
+        The stripped question is embedded, as stored questions are;
+        normalization only decides which questions share a cache entry.
+
+        Args:
+            question: Raw question text
+
+        Returns:
+            Embedding of the question
+        """
+        key = self._normalize_question(question)
+        with self._embeddings_lock:
+            embedding = self._embeddings.get(key)
+            if embedding is not None:
+                self._embeddings.move_to_end(key)
+                return embedding
+
+        embedding = self.vector_service.generate_embedding(question.strip())
+        with self._embeddings_lock:
+            self._embeddings[key] = embedding
+            if len(self._embeddings) > EMBED_CACHE_SIZE:
+                self._embeddings.popitem(last=False)
+        return embedding
 
     def check_question_exists(self, question: str,
-                              threshold: Optional[float] =
-                              None) -> Tuple[bool, Optional[Dict[str, Any]]]:
+                              threshold: Optional[float] = None,
+                              query_embedding: Optional[np.ndarray] = None,
+                              answer: str = ""
+                              ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
         Check if a question already exists in the vector database.
 
+        An exact question-answer pair that is already stored is found by
+        point ID, before any embedding or vector search.
+
         Args:
             question: The question to check
             threshold: Similarity threshold (uses default if None)
+            query_embedding: Precomputed embedding of the question, e.g.
+                from a batched encode
+            answer: Answer stored with the question, part of its point ID
 
         Returns:
             Tuple of (exists, existing_question_data)
@@ -72,49 +151,81 @@ class QuestionUpdationService:
             threshold = self.similarity_threshold
 
         try:
-            # Search for similar questions
-            search_results = self.vector_service.search(
-                query_text=question,
-                n_results=5  # Check top 5 results
+            exact = self.vector_service.retrieve([
+                self._generate_question_id(question, answer or ""),
+                self._legacy_question_id(question, answer or "")
+            ])
+            if exact:
+                logger.info("Found exact match by question ID")
+                return True, exact[0]
+
+            # Search for similar questions, embedding repeated questions
+            # only once
+            if query_embedding is None:
+                query_embedding = self._embed_question(question)
+            # Only the closest stored question can decide the outcome
+            search_results = self.vector_service.search_by_vector(
+                query_embedding,
+                n_results=1
             )
 
             if not search_results:
                 logger.info("No similar questions found in vector database")
                 return False, None
 
-            # Check if any result meets the similarity threshold
-            for result in search_results:
-                similarity = result.get('similarity', 0.0)
-                existing_question = result.get('question', '')
-
-                logger.debug(f"Comparing questions - \
-                             Similarity: {similarity:.3f}")
-                logger.debug(f"Existing: {existing_question[:100]}...")
-                logger.debug(f"New: {question[:100]}...")
+            result = search_results[0]
+            similarity = result.get('similarity', 0.0)
+            existing_question = result.get('question', '')
 
-                if similarity >= threshold:
-                    logger.info(f"Found similar question with \
-                                similarity {similarity:.3f}")
-                    return True, result
+            logger.debug("Comparing questions - Similarity: %.3f",
+                         similarity)
+            logger.debug("Existing: %s...", existing_question[:100])
+            logger.debug("New: %s...", question[:100])
 
-            # Also check for exact normalized matches (case-insensitive)
-            normalized_new = self._normalize_question(question)
-            for result in search_results:
-                existing_question = result.get('question', '')
-                normalized_existing = \
-                    self._normalize_question(existing_question)
+            if similarity >= threshold:
+                logger.info("Found similar question with similarity %.3f",
+                            similarity)
+                return True, result
 
-                if normalized_new == normalized_existing:
-                    logger.info("Found exact normalized match")
-                    return True, result
+            # Also check for an exact normalized match (case-insensitive),
+            # which matters when the threshold is set very high
+            if self._normalize_question(question) == \
+                    self._normalize_question(existing_question):
+                logger.info("Found exact normalized match")
+                return True, result
 
             logger.info("No similar questions found above threshold")
             return False, None
 
         except Exception as e:
-            logger.error(f"Error checking question existence: {e}")
+            logger.error("Error checking question existence: %s", e)
             return False, None
 
+    @staticmethod
+    def _build_document(question: str, answer: str,
+                        metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create the document stored for a generated question.
+
+        Args:
+            question: The question text
+            answer: The answer text
+            metadata: Additional metadata to store with the question
+
+        Returns:
+            Document in the format accepted by the vector service
+        """
+        md = metadata or {}
+        return {
+            'question': question.strip(),
+            'answer': (answer or "").strip(),
+            'source': 'llm_generated',
+            'timestamp': md.get('timestamp'),
+            'skill_context': md.get('skill_context'),
+            'user_id': md.get('user_id'),
+            'interview_session': md.get('interview_session')
+        }
+
     def store_question(self, question: str, answer: str = "",
                        metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -133,39 +244,30 @@ class QuestionUpdationService:
                 logger.warning("Cannot store empty question")
                 return False
 
-            # Create document structure
-            document = {
-                'question': question.strip(),
-                'answer': answer.strip() if answer else "",
-                'source': 'llm_generated',
-                'timestamp': metadata.get('timestamp') if metadata else None,
-                'skill_context':
-                    metadata.get('skill_context') if metadata else None,
-                'user_id': metadata.get('user_id') if metadata else None,
-                'interview_session':
-                    metadata.get('interview_session') if metadata else None
-            }
-
-            # Store in vector database
-            success = self.vector_service.index_documents([document])
+            # Store in vector database with a single, unacknowledged upsert
+            success = self.vector_service.upsert_if_absent(
+                self._build_document(question, answer, metadata)
+            )
 
             if success:
-                logger.info(f"Successfully stored question: \
-                            {question[:100]}...")
+                logger.info("Successfully stored question: %s...",
+                            question[:100])
                 return True
             else:
                 logger.error("Failed to store question in vector database")
                 return False
 
         except Exception as e:
-            logger.error(f"Error storing question: {e}")
+            logger.error("Error storing question: %s", e)
             return False
 
     def check_and_store_question(self,
                                  question: str,
                                  answer: str = "",
                                  metadata: Optional[Dict[str, Any]] = None,
-                                 force_store: bool = False) -> Dict[str, Any]:
+                                 force_store: bool = False,
+                                 query_embedding: Optional[np.ndarray] = None
+                                 ) -> Dict[str, Any]:
         """
         Check if a question exists and store it if it doesn't.
 
@@ -174,59 +276,121 @@ class QuestionUpdationService:
             answer: The answer text (optional)
             metadata: Additional metadata
             force_store: If True, store even if similar question exists
+            query_embedding: Precomputed embedding of the question
 
         Returns:
             Dictionary with operation results
         """
         try:
-            result = {
-                'question': question,
-                'exists': False,
-                'stored': False,
-                'similar_question': None,
-                'similarity_score': 0.0,
-                'action_taken': 'none'
-            }
+            # Check before storing, even when forced: a concurrent store
+            # could make the check match the question itself
+            exists, existing_data = self.check_question_exists(
+                question, query_embedding=query_embedding, answer=answer
+            )
+            return self._store_unless_exists(question, answer, metadata,
+                                             force_store, exists,
+                                             existing_data)
 
-            # Check if question already exists
-            exists, existing_data = self.check_question_exists(question)
-            result['exists'] = exists
+        except Exception as e:
+            logger.error("Error in check_and_store_question: %s", e)
+            return self._error_result(question, e)
+
+    def _store_unless_exists(self,
+                             question: str,
+                             answer: str,
+                             metadata: Optional[Dict[str, Any]],
+                             force_store: bool,
+                             exists: bool,
+                             existing_data: Optional[Dict[str, Any]],
+                             stored: Optional[bool] = None
+                             ) -> Dict[str, Any]:
+        """
+        Store a question according to the outcome of its existence check.
 
-            if existing_data:
-                result['similar_question'] = existing_data.get('question')
-                result['similarity_score'] = \
-                    existing_data.get('similarity', 0.0)
+        Args:
+            question: The question text
+            answer: The answer text
+            metadata: Additional metadata
+            force_store: If True, store even if similar question exists
+            exists: Whether a similar question was found
+            existing_data: Data of the similar question, if any
+            stored: Outcome of a store that was already issued, if any
 
-            if not exists or force_store:
-                # Store the question
+        Returns:
+            Dictionary with operation results
+        """
+        result = {
+            'question': question,
+            'exists': exists,
+            'stored': False,
+            'similar_question': None,
+            'similarity_score': 0.0,
+            'action_taken': 'none'
+        }
+
+        if existing_data:
+            result['similar_question'] = existing_data.get('question')
+            result['similarity_score'] = \
+                existing_data.get('similarity', 0.0)
+
+        if not exists or force_store:
+            # Store the question
+            if stored is None:
                 stored = self.store_question(question, answer, metadata)
-                result['stored'] = stored
+            result['stored'] = stored
 
-                if stored:
-                    if exists and force_store:
-                        result['action_taken'] = 'stored_despite_similarity'
-                    else:
-                        result['action_taken'] = 'stored_new_question'
+            if stored:
+                if exists and force_store:
+                    result['action_taken'] = 'stored_despite_similarity'
                 else:
-                    result['action_taken'] = 'storage_failed'
+                    result['action_taken'] = 'stored_new_question'
             else:
-                result['action_taken'] = 'skipped_similar_exists'
-                logger.info(f"Skipping storage - similar question exists with \
-                            similarity {result['similarity_score']:.3f}")
+                result['action_taken'] = 'storage_failed'
+        else:
+            result['action_taken'] = 'skipped_similar_exists'
+            logger.info("Skipping storage - similar question exists with "
+                        "similarity %.3f", result['similarity_score'])
 
-            return result
+        return result
 
-        except Exception as e:
-            logger.error(f"Error in check_and_store_question: {e}")
-            return {
-                'question': question,
-                'exists': False,
-                'stored': False,
-                'similar_question': None,
-                'similarity_score': 0.0,
-                'action_taken': 'error',
-                'error': str(e)
-            }
+    @staticmethod
+    def _repeat_result(question: str,
+                       first: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the result for a repeat of a question earlier in a batch.
+
+        Args:
+            question: The repeated question text
+            first: Result of the first occurrence
+
+        Returns:
+            Dictionary with operation results
+        """
+        if not first['stored']:
+            return dict(first, question=question)
+
+        # The first occurrence was just stored, so this one matches it
+        return {
+            'question': question,
+            'exists': True,
+            'stored': False,
+            'similar_question': first['question'],
+            'similarity_score': 1.0,
+            'action_taken': 'skipped_similar_exists'
+        }
+
+    @staticmethod
+    def _error_result(question: str, error: Exception) -> Dict[str, Any]:
+        """Build the result returned when processing a question fails."""
+        return {
+            'question': question,
+            'exists': False,
+            'stored': False,
+            'similar_question': None,
+            'similarity_score': 0.0,
+            'action_taken': 'error',
+            'error': str(error)
+        }
 
     def batch_check_and_store(self, questions_data:
                               List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -242,16 +406,91 @@ class QuestionUpdationService:
             List of results for each question
         """
         results = []
+        if not questions_data:
+            return results
 
+        # Only the first occurrence of each normalized question goes
+        # through embedding and search; repeats reuse its result
+        first_index: Dict[str, int] = {}
+        keys = []
         for i, question_data in enumerate(questions_data):
+            key = self._normalize_question(question_data.get('question', ''))
+            first_index.setdefault(key, i)
+            keys.append(key)
+        unique_data = [questions_data[i] for i in first_index.values()]
+
+        if len(unique_data) < len(questions_data):
+            logger.info("Deduplicated batch: %s unique of %s questions",
+                        len(unique_data), len(questions_data))
+
+        # Embed every question in batched forward passes up front, instead
+        # of one encoder call per question
+        try:
+            embeddings = self.vector_service.generate_embeddings(
+                [data.get('question', '').strip() for data in unique_data]
+            )
+        except Exception as e:
+            logger.error("Error embedding batch: %s", e)
+            return [dict(self._error_result(data.get('question', ''), e),
+                         batch_index=i)
+                    for i, data in enumerate(questions_data)]
+        embedding_by_key = dict(zip(first_index, embeddings))
+
+        # Run the existence checks with a couple of searches in flight;
+        # Qdrant throughput stops improving beyond that
+        with ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY) as pool:
+            checks = dict(zip(first_index, pool.map(
+                lambda item: self.check_question_exists(
+                    item[0].get('question', ''), query_embedding=item[1],
+                    answer=item[0].get('answer', '')
+                ),
+                zip(unique_data, embeddings)
+            )))
+
+        # Store every new question with a single bulk upsert, reusing the
+        # embeddings computed above
+        to_store = {
+            key: self._build_document(
+                data.get('question', ''), data.get('answer', ''),
+                data.get('metadata', {})
+            )
+            for key, data in zip(first_index, unique_data)
+            if not checks[key][0] and data.get('question', '').strip()
+        }
+        stored = False
+        if to_store:
+            try:
+                stored = self.vector_service.index_documents(
+                    list(to_store.values()),
+                    embeddings=[embedding_by_key[key] for key in to_store]
+                )
+            except Exception as e:
+                logger.error("Error storing batch: %s", e)
+            if not stored:
+                logger.error("Failed to store batch in vector database")
+
+        # Build the results in input order
+        processed: Dict[str, Dict[str, Any]] = {}
+        for i, (question_data, key) in enumerate(zip(questions_data, keys)):
             question = question_data.get('question', '')
             answer = question_data.get('answer', '')
             metadata = question_data.get('metadata', {})
 
-            logger.info(f"Processing question {i+1}/{len(questions_data)}")
-
-            result = self.check_and_store_question(question, answer, metadata)
-            result['batch_index'] = i
+            if key in processed:
+                result = self._repeat_result(question, processed[key])
+            else:
+                exists, existing_data = checks[key]
+                try:
+                    result = self._store_unless_exists(
+                        question, answer, metadata, False, exists,
+                        existing_data, stored=stored and key in to_store
+                    )
+                except Exception as e:
+                    logger.error("Error in batch_check_and_store: %s", e)
+                    result = self._error_result(question, e)
+                processed[key] = result
+
+            result = dict(result, batch_index=i)
             results.append(result)
 
         # Log summary
@@ -261,8 +500,8 @@ class QuestionUpdationService:
                             'skipped_similar_exists')
         error_count = sum(1 for r in results if r['action_taken'] == 'error')
 
-        logger.info(f"Batch processing complete: {stored_count} stored, "
-                    f"{skipped_count} skipped, {error_count} errors")
+        logger.info("Batch processing complete: %s stored, %s skipped, %s "
+                    "errors", stored_count, skipped_count, error_count)
 
         return results
 
@@ -279,12 +518,12 @@ class QuestionUpdationService:
         if 0.0 <= new_threshold <= 1.0:
             old_threshold = self.similarity_threshold
             self.similarity_threshold = new_threshold
-            logger.info(f"Updated similarity threshold \
-                from {old_threshold} to {new_threshold}")
+            logger.info("Updated similarity threshold from %s to %s",
+                        old_threshold, new_threshold)
             return True
         else:
-            logger.error(f"Invalid threshold value: \
-                {new_threshold}. Must be between 0.0 and 1.0")
+            logger.error("Invalid threshold value: %s. Must be between 0.0 "
+                         "and 1.0", new_threshold)
             return False
 
     def get_service_stats(self) -> Dict[str, Any]:
@@ -305,7 +544,7 @@ class QuestionUpdationService:
                 'collection_info': collection_info
             }
         except Exception as e:
-            logger.error(f"Error getting service stats: {e}")
+            logger.error("Error getting service stats: %s", e)
             return {
                 'service_status': 'error',
                 'error': str(e)
@@ -12,8 +12,6 @@ import logging
 from ..utils.qdrant_service import get_qdrant_service, \
     initialize_vector_database, force_reindex_database
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/vector", tags=["vector"])
@@ -50,14 +48,18 @@ async def search_vectors(request: VectorSearchRequest):
                     Please check Qdrant configuration."
             )
 
-        # Auto-initialize only if needed (first time or if collection is empty)
-        if not service.collection_exists_and_has_data():
-            logger.info("Collection needs initialization, initializing now...")
-            if not service.auto_initialize_if_needed():
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to initialize vector database"
-                )
+        # Auto-initialize only if needed (first time or if collection is
+        # empty); once ready, later requests skip the Qdrant round trip
+        if not service.initialized:
+            if not service.collection_exists_and_has_data():
+                logger.info("Collection needs initialization, "
+                            "initializing now...")
+                if not service.auto_initialize_if_needed():
+                    raise HTTPException(
+                        status_code=500,
+                        detail="Failed to initialize vector database"
+                    )
+            service.initialized = True
 
         # Perform search
         results = service.search(request.text, request.n_chunks)
@@ -0,0 +1,24 @@
+"""
+Shared test fixtures.
+
+Some services are created at import time, so the Gemini key and the shared
+vector service are stubbed before any service module is imported.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from aptwise.utils import qdrant_service  # noqa: E402
+
+from .fakes import FakeVectorService  # noqa: E402
+
+# Services created at import time share this instead of loading the model
+qdrant_service._vector_service = FakeVectorService()
+
+
+@pytest.fixture
+def vector_service() -> FakeVectorService:
+    """A fresh, empty fake vector service."""
+    return FakeVectorService()
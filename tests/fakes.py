@@ -0,0 +1,111 @@
+"""
+In-memory stand-ins for the embedding model and the Qdrant vector service.
+"""
+import re
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from aptwise.utils.qdrant_service import _content_digest
+
+EMBEDDING_DIM = 256
+
+
+class FakeModel:
+    """Hashed bag-of-words encoder standing in for the sentence transformer."""
+
+    def encode(self, texts: List[str], **kwargs) -> np.ndarray:
+        embeddings = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in re.findall(r'\w+', text.lower()):
+                embeddings[i, zlib.crc32(word.encode()) % EMBEDDING_DIM] += 1
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+
+
+class FakeVectorService:
+    """In-memory stand-in for QdrantVectorService."""
+
+    embedding_dim = EMBEDDING_DIM
+
+    def __init__(self):
+        self.model = FakeModel()
+        self.qdrant_client = None
+        self.points: Dict[str, Dict[str, Any]] = {}
+        self.calls: Counter = Counter()
+
+    def add(self, question: str, answer: str = "",
+            point_id: Optional[str] = None) -> str:
+        """Store a point, by default under its content-derived ID."""
+        point_id = point_id or _content_digest(question, answer).hex()
+        self.points[point_id] = {
+            'question': question,
+            'answer': answer,
+            'vector': self.model.encode([question])[0]
+        }
+        return point_id
+
+    def generate_embedding(self, text: str) -> np.ndarray:
+        self.calls['encode'] += 1
+        return self.model.encode([text])[0]
+
+    def generate_embeddings(self, texts: List[str],
+                            batch_size: int = 64) -> np.ndarray:
+        self.calls['encode'] += 1
+        return self.model.encode(texts)
+
+    def search_by_vector(self, query_embedding: np.ndarray,
+                         n_results: int = 5,
+                         local: bool = False) -> List[Dict[str, Any]]:
+        self.calls['search'] += 1
+        ranked = sorted(
+            ((float(point['vector'] @ query_embedding), point_id, point)
+             for point_id, point in self.points.items()),
+            key=lambda item: -item[0]
+        )[:n_results]
+        return [
+            {'id': point_id, 'question': point['question'],
+             'answer': point['answer'], 'similarity': score, 'rank': rank}
+            for rank, (score, point_id, point) in enumerate(ranked, 1)
+        ]
+
+    def search(self, query_text: str, n_results: int = 5,
+               local: bool = False) -> List[Dict[str, Any]]:
+        return self.search_by_vector(self.model.encode([query_text])[0],
+                                     n_results)
+
+    def search_batch(self, query_texts: List[str],
+                     n_results: int = 5) -> List[List[Dict[str, Any]]]:
+        return [self.search(query_text, n_results)
+                for query_text in query_texts]
+
+    def retrieve(self, point_ids: List[str]) -> List[Dict[str, Any]]:
+        self.calls['retrieve'] += 1
+        found = [point_id for point_id in point_ids
+                 if point_id in self.points]
+        return [
+            {'id': point_id, 'question': self.points[point_id]['question'],
+             'answer': self.points[point_id]['answer'], 'similarity': 1.0,
+             'rank': rank}
+            for rank, point_id in enumerate(found, 1)
+        ]
+
+    def index_documents(self, documents: List[Dict[str, Any]],
+                        batch_size: int = 64,
+                        embeddings: Optional[List[np.ndarray]] = None
+                        ) -> bool:
+        self.calls['index'] += 1
+        if embeddings is None:
+            self.calls['encode'] += 1
+        for document in documents:
+            self.add(document['question'].strip(),
+                     document.get('answer', '').strip())
+        return True
+
+    def upsert_if_absent(self, document: Dict[str, Any]) -> bool:
+        self.calls['upsert'] += 1
+        self.add(document['question'].strip(),
+                 document.get('answer', '').strip())
+        return True
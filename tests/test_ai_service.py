@@ -0,0 +1,115 @@
+"""
+Tests for local answer scoring in the AI interview service.
+"""
+import re
+
+import numpy as np
+import pytest
+
+from aptwise.interview.ai_service import AIInterviewService
+
+QUESTION = "What is the difference between a list and a tuple in Python?"
+REFERENCE = {
+    'question': QUESTION,
+    'answer': "A list is mutable while a tuple is immutable, so a tuple "
+              "can be used as a dictionary key."
+}
+OTHER_TOPIC = {
+    'question': "How does a SQL index speed up queries?",
+    'answer': "An index is a B-tree over column values that lets the "
+              "database skip full table scans."
+}
+
+
+class FakeModel:
+    """Bag-of-words encoder standing in for the sentence transformer."""
+
+    def encode(self, texts, convert_to_numpy=True,
+               normalize_embeddings=True):
+        vocab = {}
+        rows = []
+        for text in texts:
+            row = {}
+            for word in re.findall(r'\w+', text.lower()):
+                index = vocab.setdefault(word, len(vocab))
+                row[index] = row.get(index, 0) + 1
+            rows.append(row)
+
+        embeddings = np.zeros((len(texts), len(vocab)), dtype=np.float32)
+        for i, row in enumerate(rows):
+            for index, count in row.items():
+                embeddings[i, index] = count
+        return embeddings / np.linalg.norm(embeddings, axis=1,
+                                           keepdims=True)
+
+
+class FakeVectorService:
+    """Qdrant stand-in returning references by query text."""
+
+    def __init__(self):
+        self.model = FakeModel()
+        self.queries = []
+
+    def search(self, query_text, n_results=5):
+        self.queries.append(query_text)
+        if 'tuple' in query_text:
+            return [REFERENCE]
+        return [OTHER_TOPIC]
+
+
+@pytest.fixture
+def service():
+    service = AIInterviewService.__new__(AIInterviewService)
+    service.vector_service = FakeVectorService()
+    return service
+
+
+def _history(answer):
+    return "\n".join([
+        "aptwise: Hi! Let's start with Python.",
+        "user: Sounds good.",
+        f"aptwise: Great. {QUESTION}",
+        f"user: {answer}"
+    ])
+
+
+def test_references_come_from_the_question_just_answered(service):
+    references = service.get_answer_references(_history("No idea."))
+
+    assert service.vector_service.queries == [QUESTION]
+    assert references == [REFERENCE]
+
+
+def test_good_answer_scores_high(service):
+    history = _history("A list is mutable, a tuple is immutable so a "
+                       "tuple can be used as a dictionary key.")
+    references = service.get_answer_references(history)
+
+    evaluation = service.evaluate_response(
+        service._get_latest_user_response(history), references
+    )
+
+    assert evaluation['correctness'] >= 4
+    assert evaluation['completeness'] >= 4
+    assert evaluation['confidence'] >= 4
+
+
+def test_unrelated_answer_scores_low(service):
+    history = _history("I usually deploy with Docker on weekends.")
+    references = service.get_answer_references(history)
+
+    evaluation = service.evaluate_response(
+        service._get_latest_user_response(history), references
+    )
+
+    assert evaluation['correctness'] <= 2
+
+
+@pytest.mark.parametrize("history", [
+    "No previous conversation.",
+    "aptwise: Hi! What is a tuple?",
+    "user: Hello there."
+])
+def test_no_references_without_an_answered_question(service, history):
+    assert service.get_answer_references(history) == []
+    assert service.vector_service.queries == []
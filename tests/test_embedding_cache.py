@@ -0,0 +1,27 @@
+"""
+Tests for the on-disk embedding cache.
+"""
+import numpy as np
+
+from aptwise.utils.embedding_cache import EmbeddingCache
+
+
+def test_embeddings_round_trip(tmp_path):
+    cache = EmbeddingCache("all-MiniLM-L6-v2", cache_dir=str(tmp_path))
+    cache.put_many([("key", np.ones(3))])
+
+    found = cache.get_many(["key", "missing"])
+
+    assert list(found) == ["key"]
+    assert found["key"].dtype == np.float32
+
+
+def test_unwritable_cache_dir_disables_the_cache(tmp_path):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+
+    cache = EmbeddingCache("all-MiniLM-L6-v2",
+                           cache_dir=str(not_a_dir / "cache"))
+    cache.put_many([("key", np.ones(3))])
+
+    assert cache.get_many(["key"]) == {}
@@ -0,0 +1,187 @@
+"""
+Tests for the interview evaluation service, with Gemini, Qdrant and the
+database stubbed. The evaluation runs once per session and the tests
+below assert on its result.
+"""
+import copy
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from aptwise.evaluation import evaluation_service as module
+from aptwise.evaluation.evaluation_service import InterviewEvaluationService
+
+from .fakes import FakeVectorService
+
+SKILLS = ["Python", "Django", "REST APIs"]
+USER_EMAIL = "candidate@example.com"
+
+# One reference pair and one interview question per skill
+REFERENCES = {
+    "Python": ("What is a Python generator?",
+               "A function that yields values lazily."),
+    "Django": ("What does the Django ORM do?",
+               "It maps Python classes to database tables."),
+    "REST APIs": ("What makes a REST API stateless?",
+                  "Each request carries all the state it needs.")
+}
+
+INTERVIEW_DATA = {'company': 'Acme', 'role': 'Backend Engineer',
+                  'userName': 'Sam', 'skills': SKILLS}
+CONVERSATION = [
+    message
+    for question, answer in REFERENCES.values()
+    for message in ({'role': 'assistant', 'content': question},
+                    {'role': 'user', 'content': answer})
+]
+
+GEMINI_EVALUATION = {
+    'final_score': 78,
+    'overall_feedback': "Solid fundamentals.",
+    'strengths': ["Clear explanations"],
+    'areas_for_improvement': ["Go deeper on ORM internals"],
+    'interview_grade': "B+",
+    'reference_coverage_score': 70,
+    'skill_performance_summary': {
+        'Python': {'score': 82, 'feedback': "Good"},
+        'Django': {'score': 74, 'feedback': "Adequate"}
+    },
+    'skill_level_assessment': {'Python': 4, 'Django': 3},
+    'detailed_breakdown': [
+        {'question_number': 1, 'question': REFERENCES['Python'][0],
+         'user_answer': REFERENCES['Python'][1],
+         'evaluation': {'correctness': {'score': 90},
+                        'completeness': {'score': 80},
+                        'confidence': {'score': 70}}},
+        {'question_number': 2, 'question': REFERENCES['Django'][0],
+         'user_answer': REFERENCES['Django'][1],
+         'evaluation': {'correctness': {'score': 70},
+                        'completeness': {'score': 60},
+                        'confidence': {'score': 50}}}
+    ],
+    'technical_competency': {'score': 80, 'feedback': "Good"}
+}
+
+
+class FakeGeminiModel:
+    """Returns a canned evaluation and records the prompts it receives."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        return SimpleNamespace(
+            text=f"```json\n{json.dumps(GEMINI_EVALUATION)}\n```"
+        )
+
+
+@pytest.fixture(scope="session")
+def evaluation():
+    """Run the evaluation once and share the service and its result."""
+    skill_updates = []
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(module, 'get_user_skills', lambda email: [
+            {'skill': 'Python', 'proficiency': 3}
+        ])
+        mp.setattr(module, 'update_user_skills_from_evaluation',
+                   lambda email, updates: skill_updates.append(updates)
+                   or True)
+
+        service = InterviewEvaluationService()
+        service.vector_service = FakeVectorService()
+        for question, answer in REFERENCES.values():
+            service.vector_service.add(question, answer)
+        service.model = FakeGeminiModel()
+
+        result = service.evaluate_interview(INTERVIEW_DATA, CONVERSATION,
+                                            USER_EMAIL)
+
+    return SimpleNamespace(service=service, result=result,
+                           skill_updates=skill_updates)
+
+
+@pytest.fixture(scope="session")
+def evaluation_result(evaluation):
+    return evaluation.result
+
+
+@pytest.fixture(scope="session")
+def metrics(evaluation):
+    return evaluation.service.extract_assessment_metrics(evaluation.result)
+
+
+@pytest.mark.parametrize("skill", SKILLS)
+def test_reference_context(evaluation, skill):
+    question, answer = REFERENCES[skill]
+
+    context = evaluation.service.get_reference_context(SKILLS, CONVERSATION)
+    match = next(ref for ref in context['questions_with_references']
+                 if ref['interview_question'] == question)
+
+    assert match['reference_question'] == question
+    assert match['reference_answer'] == answer
+    assert match['similarity_score'] == pytest.approx(1.0)
+
+
+def test_evaluation_result(evaluation, evaluation_result):
+    assert evaluation_result['success']
+    assert evaluation_result['reference_context_used'] == len(SKILLS)
+    assert evaluation_result['skills_updated']
+    assert evaluation.skill_updates == [
+        GEMINI_EVALUATION['skill_level_assessment']
+    ]
+    # The user's current skill levels and the references reach the prompt
+    prompt = evaluation.service.model.prompts[0]
+    assert "Python: Level 3/5" in prompt
+    assert REFERENCES['Django'][1] in prompt
+
+
+@pytest.mark.parametrize("skill, assessed", [
+    ("Python", True),
+    ("Django", True),
+    ("REST APIs", False)
+])
+def test_evaluation_result_skills(evaluation_result, skill, assessed):
+    evaluation = evaluation_result['evaluation']
+    not_assessed = [entry['skill']
+                    for entry in evaluation['skills_not_assessed']]
+
+    assert (skill in evaluation['skill_performance_summary']) is assessed
+    assert (skill in not_assessed) is not assessed
+
+
+def test_metrics_extraction(metrics):
+    assert metrics['success']
+    assert metrics['overall_score'] == 78
+    assert metrics['interview_grade'] == "B+"
+    assert metrics['total_questions_assessed'] == 2
+    assert metrics['assessment_averages'] == {
+        'correctness': 80.0, 'completeness': 70.0, 'confidence': 60.0
+    }
+    assert metrics['dimension_scores']['technical_competency'] == 80
+
+
+@pytest.mark.parametrize("skill", ["Python", "Django"])
+def test_metrics_extraction_skill_scores(metrics, skill):
+    assert metrics['skill_performance_summary'][skill]['score'] == \
+        GEMINI_EVALUATION['skill_performance_summary'][skill]['score']
+
+
+def test_summary(evaluation, evaluation_result):
+    summary = evaluation.service.get_evaluation_summary(evaluation_result)
+
+    assert "Score: 78/100, Grade: B+" in summary
+    assert "Key Strength: Clear explanations." in summary
+
+
+def test_repeat_summary_is_served_from_the_cache(evaluation,
+                                                 evaluation_result):
+    summary = evaluation.service.get_evaluation_summary(evaluation_result)
+    hits = module._format_summary.cache_info().hits
+
+    assert evaluation.service.get_evaluation_summary(
+        copy.deepcopy(evaluation_result)) == summary
+    assert module._format_summary.cache_info().hits == hits + 1
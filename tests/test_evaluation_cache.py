@@ -0,0 +1,136 @@
+"""
+Tests for reusing evaluations across the evaluation endpoints.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aptwise.evaluation import evaluation_service as module
+from aptwise.evaluation.evaluation_service import InterviewEvaluationService
+
+INTERVIEW = {'company': 'Acme', 'role': 'Backend Engineer',
+             'skills': ['Python']}
+HISTORY = [
+    {'role': 'assistant', 'content': 'What is a Python generator?'},
+    {'role': 'user', 'content': 'A function that yields values lazily.'}
+]
+
+
+@pytest.fixture
+def service(monkeypatch, vector_service):
+    monkeypatch.setattr(module, 'get_qdrant_service', lambda: vector_service)
+    service = InterviewEvaluationService()
+    service.evaluations = []
+
+    def evaluate_interview(interview_data, conversation_history,
+                           user_email=None):
+        service.evaluations.append(interview_data)
+        return {'success': True,
+                'evaluation': {'overall_score': 80,
+                               'strengths': ['Clear answers']}}
+
+    monkeypatch.setattr(service, 'evaluate_interview', evaluate_interview)
+    return service
+
+
+def test_repeat_requests_reuse_one_evaluation(service):
+    first = service.get_or_evaluate_interview(INTERVIEW, HISTORY, 'a@b.c')
+    second = service.get_or_evaluate_interview(INTERVIEW, HISTORY, 'a@b.c')
+
+    assert first == second
+    assert len(service.evaluations) == 1
+
+
+def test_each_caller_gets_its_own_copy(service):
+    first = service.get_or_evaluate_interview(INTERVIEW, HISTORY)
+    first['evaluation']['strengths'].append('Mutated by a route')
+
+    second = service.get_or_evaluate_interview(INTERVIEW, HISTORY)
+
+    assert second['evaluation']['strengths'] == ['Clear answers']
+
+
+def test_different_input_is_evaluated_again(service):
+    service.get_or_evaluate_interview(INTERVIEW, HISTORY, 'a@b.c')
+    service.get_or_evaluate_interview(INTERVIEW, HISTORY, 'x@y.z')
+
+    assert len(service.evaluations) == 2
+
+
+def test_expired_result_is_evaluated_again(service, monkeypatch):
+    monkeypatch.setattr(module, 'RESULT_CACHE_TTL_SECONDS', 0)
+
+    service.get_or_evaluate_interview(INTERVIEW, HISTORY)
+    service.get_or_evaluate_interview(INTERVIEW, HISTORY)
+
+    assert len(service.evaluations) == 2
+
+
+def test_least_recently_used_result_is_evicted(service, monkeypatch):
+    monkeypatch.setattr(module, 'RESULT_CACHE_MAX_ENTRIES', 2)
+
+    for email in ('a@b.c', 'd@e.f', 'g@h.i', 'a@b.c'):
+        service.get_or_evaluate_interview(INTERVIEW, HISTORY, email)
+
+    assert len(service.evaluations) == 4
+
+
+def test_failures_are_not_cached(service, monkeypatch):
+    monkeypatch.setattr(
+        service, 'evaluate_interview',
+        lambda *args: service.evaluations.append(args) or {'success': False}
+    )
+
+    service.get_or_evaluate_interview(INTERVIEW, HISTORY)
+    service.get_or_evaluate_interview(INTERVIEW, HISTORY)
+
+    assert len(service.evaluations) == 2
+
+
+def test_concurrent_requests_share_one_evaluation(service, monkeypatch):
+    release = threading.Event()
+    evaluate = service.evaluate_interview
+
+    def slow_evaluate(*args):
+        release.wait(timeout=5)
+        return evaluate(*args)
+
+    monkeypatch.setattr(service, 'evaluate_interview', slow_evaluate)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(service.get_or_evaluate_interview,
+                               INTERVIEW, HISTORY)
+                   for _ in range(3)]
+        # Let every request reach the cache before the first one finishes
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(service.evaluations) == 1
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+
+
+def test_failed_evaluation_is_raised_to_waiting_callers(service,
+                                                        monkeypatch):
+    release = threading.Event()
+
+    def failing_evaluate(*args):
+        release.wait(timeout=5)
+        raise RuntimeError("Gemini unavailable")
+
+    monkeypatch.setattr(service, 'evaluate_interview', failing_evaluate)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(service.get_or_evaluate_interview,
+                               INTERVIEW, HISTORY)
+                   for _ in range(2)]
+        time.sleep(0.1)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    assert service._in_flight == {}
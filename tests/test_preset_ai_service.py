@@ -0,0 +1,27 @@
+"""
+Tests for batched preset generation in the AI preset service.
+"""
+import asyncio
+
+from google.api_core import exceptions as google_exceptions
+
+from aptwise.interview.preset_ai_service import AIPresetService
+
+
+def test_api_error_is_returned_for_the_whole_batch():
+    service = AIPresetService.__new__(AIPresetService)
+    calls = []
+
+    async def generate_content(prompt, generation_config):
+        calls.append(prompt)
+        raise google_exceptions.ResourceExhausted("Quota exceeded")
+
+    service._generate_content = generate_content
+
+    results = asyncio.run(service._generate_batch([
+        ("Backend developer", None), ("Data engineer", ['SQL'])
+    ]))
+
+    assert len(calls) == 1
+    assert [result['success'] for result in results] == [False, False]
+    assert "Quota exceeded" in results[0]['error']
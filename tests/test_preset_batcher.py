@@ -0,0 +1,76 @@
+"""
+Tests for batching concurrent preset generation requests.
+"""
+import asyncio
+
+import pytest
+
+from aptwise.interview.preset_batcher import PresetBatcher
+
+
+class RecordingBatchFn:
+    """Batch function that records each batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, payloads):
+        self.batches.append(list(payloads))
+        return [payload.upper() for payload in payloads]
+
+
+def _run(batcher, payloads, stagger=0.0):
+    """Submit payloads concurrently and return their results."""
+    async def main():
+        async def submit(i, payload):
+            await asyncio.sleep(i * stagger)
+            return await batcher.submit(payload)
+
+        try:
+            return await asyncio.gather(*(submit(i, payload)
+                                          for i, payload
+                                          in enumerate(payloads)))
+        finally:
+            await batcher.close()
+
+    return asyncio.run(main())
+
+
+def test_requests_within_the_window_share_one_batch():
+    batch_fn = RecordingBatchFn()
+    batcher = PresetBatcher(batch_fn, batch_max=8, batch_window_ms=50)
+
+    results = _run(batcher, ['a', 'b', 'c'])
+
+    assert results == ['A', 'B', 'C']
+    assert batch_fn.batches == [['a', 'b', 'c']]
+
+
+def test_full_batches_are_dispatched_without_waiting():
+    batch_fn = RecordingBatchFn()
+    batcher = PresetBatcher(batch_fn, batch_max=2, batch_window_ms=200)
+
+    results = _run(batcher, ['a', 'b', 'c', 'd', 'e'])
+
+    assert results == ['A', 'B', 'C', 'D', 'E']
+    assert batch_fn.batches == [['a', 'b'], ['c', 'd'], ['e']]
+
+
+def test_requests_after_the_window_start_a_new_batch():
+    batch_fn = RecordingBatchFn()
+    batcher = PresetBatcher(batch_fn, batch_max=8, batch_window_ms=20)
+
+    results = _run(batcher, ['a', 'b'], stagger=0.1)
+
+    assert results == ['A', 'B']
+    assert batch_fn.batches == [['a'], ['b']]
+
+
+def test_batch_failure_is_raised_to_every_caller():
+    async def failing_batch_fn(payloads):
+        raise RuntimeError("Gemini unavailable")
+
+    batcher = PresetBatcher(failing_batch_fn, batch_window_ms=10)
+
+    with pytest.raises(RuntimeError):
+        _run(batcher, ['a', 'b'])
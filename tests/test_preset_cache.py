@@ -0,0 +1,166 @@
+"""
+Tests for the preset response caches.
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from aptwise.interview.preset_cache import (
+    PresetResponseCache,
+    PresetSemanticCache
+)
+
+PRESET = {'success': True, 'preset_name': 'Frontend Developer at Google',
+          'skills': ['React', 'JavaScript']}
+
+
+class FakeQdrantClient:
+    """Just enough of QdrantClient for the semantic preset cache."""
+
+    def __init__(self):
+        self.collections = {}
+
+    def collection_exists(self, collection_name):
+        return collection_name in self.collections
+
+    def create_collection(self, collection_name, vectors_config):
+        self.collections[collection_name] = {}
+
+    def create_payload_index(self, **kwargs):
+        pass
+
+    def upsert(self, collection_name, points):
+        for point in points:
+            self.collections[collection_name][point.id] = point
+
+    def search(self, collection_name, query_vector, query_filter, limit,
+               score_threshold, with_payload):
+        not_after = query_filter.must[0].range.gt
+        hits = []
+        for point in self.collections[collection_name].values():
+            score = float(np.dot(point.vector, query_vector))
+            if point.payload['expires_at'] > not_after \
+                    and score >= score_threshold:
+                hits.append(SimpleNamespace(score=score,
+                                            payload=point.payload))
+        hits.sort(key=lambda hit: -hit.score)
+        return hits[:limit]
+
+    def delete(self, collection_name, points_selector):
+        expired_by = points_selector.filter.must[0].range.lte
+        points = self.collections[collection_name]
+        for point_id in [point_id for point_id, point in points.items()
+                         if point.payload['expires_at'] <= expired_by]:
+            del points[point_id]
+
+
+def test_response_cache_hit_ignores_case_and_skill_order():
+    cache = PresetResponseCache()
+    cache.set("Frontend developer at Google", ['React', 'CSS'], PRESET)
+
+    assert cache.get(" frontend developer at google",
+                     ['css', 'react']) == PRESET
+    assert cache.get("Frontend developer at Google", ['React']) is None
+
+
+def test_response_cache_returns_a_copy():
+    cache = PresetResponseCache()
+    cache.set("Frontend developer at Google", None, PRESET)
+
+    cache.get("Frontend developer at Google")['success'] = False
+
+    assert cache.get("Frontend developer at Google") == PRESET
+
+
+def test_response_cache_entries_expire():
+    cache = PresetResponseCache(ttl_seconds=0)
+    cache.set("Frontend developer at Google", None, PRESET)
+
+    assert cache.get("Frontend developer at Google") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = PresetResponseCache(max_entries=2)
+    cache.set("first", None, PRESET)
+    cache.set("second", None, PRESET)
+    cache.get("first")
+    cache.set("third", None, PRESET)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == PRESET
+    assert cache.get("third") == PRESET
+
+
+def test_response_cache_invalidates_every_skill_set():
+    cache = PresetResponseCache()
+    cache.set("Frontend developer at Google", None, PRESET)
+    cache.set("Frontend developer at Google", ['React'], PRESET)
+    cache.set("Backend developer", None, PRESET)
+
+    assert cache.invalidate("frontend developer at google") == 2
+    assert cache.get("Backend developer") == PRESET
+
+
+@pytest.fixture
+def semantic_cache(vector_service):
+    vector_service.qdrant_client = FakeQdrantClient()
+    return PresetSemanticCache(vector_service, threshold=0.85)
+
+
+def test_paraphrased_description_hits(semantic_cache):
+    semantic_cache.set("Frontend developer at Google", PRESET)
+
+    assert semantic_cache.get("frontend developer role at Google") == PRESET
+
+
+def test_unrelated_description_misses(semantic_cache):
+    semantic_cache.set("Frontend developer at Google", PRESET)
+
+    assert semantic_cache.get("Machine learning engineer") is None
+
+
+def test_hit_returns_a_copy(semantic_cache):
+    semantic_cache.set("Frontend developer at Google", PRESET)
+
+    semantic_cache.get("Frontend developer at Google")['skills'] = []
+
+    assert semantic_cache.get("Frontend developer at Google") == PRESET
+
+
+def test_expired_entry_misses(vector_service):
+    vector_service.qdrant_client = FakeQdrantClient()
+    cache = PresetSemanticCache(vector_service, ttl_seconds=0)
+    cache.set("Frontend developer at Google", PRESET)
+
+    assert cache.get("Frontend developer at Google") is None
+
+
+def test_sweep_deletes_expired_entries(vector_service):
+    client = vector_service.qdrant_client = FakeQdrantClient()
+    cache = PresetSemanticCache(vector_service, ttl_seconds=0)
+    cache.set("Frontend developer at Google", PRESET)
+
+    cache.sweep()
+
+    assert client.collections[cache.collection_name] == {}
+
+
+def test_embeddings_are_cached_per_instance(vector_service):
+    vector_service.qdrant_client = FakeQdrantClient()
+    first = PresetSemanticCache(vector_service)
+    second = PresetSemanticCache(vector_service)
+
+    first.get("Frontend developer at Google")
+    first.get("Frontend developer at Google")
+    assert vector_service.calls['encode'] == 1
+
+    second.get("Frontend developer at Google")
+    assert vector_service.calls['encode'] == 2
+
+
+def test_lookup_without_qdrant_misses(vector_service):
+    cache = PresetSemanticCache(vector_service)
+    cache.set("Frontend developer at Google", PRESET)
+
+    assert cache.get("Frontend developer at Google") is None
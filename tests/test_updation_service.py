@@ -0,0 +1,157 @@
+"""
+Tests for checking and storing generated interview questions.
+"""
+import pytest
+
+from aptwise.utils.updation_service import QuestionUpdationService
+
+QUESTION = "What is a Python decorator?"
+ANSWER = "A callable that wraps another function."
+
+
+@pytest.fixture
+def service(vector_service):
+    service = QuestionUpdationService()
+    service._vector_service = vector_service
+    return service
+
+
+def test_exact_match_is_found_by_point_id(service, vector_service):
+    vector_service.add(QUESTION, ANSWER)
+
+    exists, existing = service.check_question_exists(QUESTION,
+                                                     answer=ANSWER)
+
+    assert exists
+    assert existing['question'] == QUESTION
+    assert vector_service.calls['encode'] == 0
+    assert vector_service.calls['search'] == 0
+
+
+def test_exact_match_is_found_by_legacy_md5_id(service, vector_service):
+    vector_service.add(QUESTION, ANSWER,
+                       point_id=service._legacy_question_id(QUESTION,
+                                                            ANSWER))
+
+    exists, existing = service.check_question_exists(QUESTION,
+                                                     answer=ANSWER)
+
+    assert exists
+    assert existing['question'] == QUESTION
+    assert vector_service.calls['search'] == 0
+
+
+def test_similar_question_falls_back_to_search(service, vector_service):
+    vector_service.add(QUESTION, "A different answer.")
+
+    exists, existing = service.check_question_exists(
+        "what is a python decorator", answer=ANSWER
+    )
+
+    assert exists
+    assert existing['question'] == QUESTION
+    assert vector_service.calls['search'] == 1
+
+
+def test_new_question_does_not_exist(service, vector_service):
+    vector_service.add(QUESTION, ANSWER)
+
+    exists, existing = service.check_question_exists(
+        "How does SQL indexing work?"
+    )
+
+    assert not exists
+    assert existing is None
+
+
+def test_repeat_checks_embed_the_raw_question_once(service, vector_service,
+                                                   monkeypatch):
+    embedded = []
+    generate_embedding = vector_service.generate_embedding
+    monkeypatch.setattr(vector_service, 'generate_embedding',
+                        lambda text: embedded.append(text)
+                        or generate_embedding(text))
+
+    service.check_question_exists("  " + QUESTION)
+    service.check_question_exists("what is a python decorator")
+
+    assert embedded == [QUESTION]
+
+
+def test_batch_embeds_each_unique_question_once(service, vector_service):
+    results = service.batch_check_and_store([
+        {'question': QUESTION, 'answer': ANSWER},
+        {'question': "what is a python decorator", 'answer': ANSWER},
+        {'question': "How does SQL indexing work?", 'answer': ""}
+    ])
+
+    assert vector_service.calls['encode'] == 1
+    assert vector_service.calls['index'] == 1
+    assert len(vector_service.points) == 2
+    assert [r['batch_index'] for r in results] == [0, 1, 2]
+    assert [r['action_taken'] for r in results] == [
+        'stored_new_question', 'skipped_similar_exists',
+        'stored_new_question'
+    ]
+    assert results[1]['similar_question'] == QUESTION
+
+
+def test_batch_embedding_failure_fails_every_question(
+        service, vector_service, monkeypatch):
+    def failing_generate_embeddings(texts, batch_size=64):
+        raise RuntimeError("CUDA out of memory")
+
+    monkeypatch.setattr(vector_service, 'generate_embeddings',
+                        failing_generate_embeddings)
+
+    results = service.batch_check_and_store([
+        {'question': QUESTION, 'answer': ANSWER},
+        {'question': "How does SQL indexing work?", 'answer': ""}
+    ])
+
+    assert [r['action_taken'] for r in results] == ['error', 'error']
+    assert [r['batch_index'] for r in results] == [0, 1]
+    assert vector_service.calls['index'] == 0
+
+
+def test_batch_repeats_reuse_the_first_check(service, vector_service):
+    vector_service.add(QUESTION, ANSWER)
+
+    results = service.batch_check_and_store([
+        {'question': QUESTION, 'answer': ANSWER},
+        {'question': QUESTION + "  ", 'answer': ANSWER}
+    ])
+
+    assert vector_service.calls['retrieve'] == 1
+    assert vector_service.calls['index'] == 0
+    assert [r['action_taken'] for r in results] == [
+        'skipped_similar_exists', 'skipped_similar_exists'
+    ]
+    assert results[1]['question'] == QUESTION + "  "
+
+
+def test_empty_batch_does_nothing(service, vector_service):
+    assert service.batch_check_and_store([]) == []
+    assert not vector_service.calls
+
+
+def test_forced_store_of_new_question_is_not_similar_to_itself(
+        service, vector_service):
+    result = service.check_and_store_question(QUESTION, ANSWER,
+                                              force_store=True)
+
+    assert result['action_taken'] == 'stored_new_question'
+    assert result['similar_question'] is None
+    assert len(vector_service.points) == 1
+
+
+def test_forced_store_reports_the_existing_similar_question(
+        service, vector_service):
+    vector_service.add("What is a decorator in Python?", "")
+
+    result = service.check_and_store_question(QUESTION, ANSWER,
+                                              force_store=True)
+
+    assert result['action_taken'] == 'stored_despite_similarity'
+    assert result['similar_question'] == "What is a decorator in Python?"
+    assert len(vector_service.points) == 2